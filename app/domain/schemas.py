@@ -7,6 +7,7 @@ from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     PositiveFloat,
     ValidationInfo,
@@ -354,6 +355,8 @@ class IntakeSubmission(BaseModel):
 class PreferenceWeights(BaseModel):
     """Calculated weights applied during optimization."""
 
+    model_config = ConfigDict(frozen=True)
+
     expected_cost: float = 1.0
     payment_volatility: float
     cpi_exposure: float
@@ -363,6 +366,8 @@ class PreferenceWeights(BaseModel):
 class SoftCaps(BaseModel):
     """Soft caps derived from preferences."""
 
+    model_config = ConfigDict(frozen=True)
+
     variable_share_max: float
     cpi_share_max: Optional[float] = None
     payment_ceiling_nis: Optional[float] = None
@@ -371,6 +376,8 @@ class SoftCaps(BaseModel):
 class ScenarioWeights(BaseModel):
     """Scenario weights for rate outlook."""
 
+    model_config = ConfigDict(frozen=True)
+
     fall: float
     flat: float
     rise: float
@@ -379,6 +386,8 @@ class ScenarioWeights(BaseModel):
 class PrepaymentEvent(BaseModel):
     """Represents an anticipated prepayment event."""
 
+    model_config = ConfigDict(frozen=True)
+
     month: int
     pct_of_balance: float
 
@@ -386,6 +395,8 @@ class PrepaymentEvent(BaseModel):
 class PlanningContext(BaseModel):
     """Derived planning inputs consumed by optimization/eligibility tools."""
 
+    model_config = ConfigDict(frozen=True)
+
     weights: PreferenceWeights
     soft_caps: SoftCaps
     scenario_weights: ScenarioWeights
@@ -399,6 +410,8 @@ class PlanningContext(BaseModel):
 class FeasibilityIssue(BaseModel):
     """Represents a blocking issue discovered during quick feasibility checks."""
 
+    model_config = ConfigDict(frozen=True)
+
     code: str
     message: str
     details: Dict[str, Any] = Field(default_factory=dict)
@@ -407,6 +420,8 @@ class FeasibilityIssue(BaseModel):
 class FeasibilityResult(BaseModel):
     """Summary of the quick feasibility check run during intake triage."""
 
+    model_config = ConfigDict(frozen=True)
+
     is_feasible: bool
     ltv_ratio: float
     ltv_limit: float
@@ -423,6 +438,8 @@ class FeasibilityResult(BaseModel):
 class TrackShares(BaseModel):
     """Distribution of loan across track categories."""
 
+    model_config = ConfigDict(frozen=True)
+
     fixed_unindexed: float
     fixed_cpi: float
     variable_prime: float
@@ -440,6 +457,8 @@ class TrackShares(BaseModel):
 class TrackDetail(BaseModel):
     """Describes a single track component within a mix."""
 
+    model_config = ConfigDict(frozen=True)
+
     track: str
     amount_nis: float
     rate_display: str
@@ -451,6 +470,8 @@ class TrackDetail(BaseModel):
 class PaymentSensitivity(BaseModel):
     """Represents payment under a simple shock scenario."""
 
+    model_config = ConfigDict(frozen=True)
+
     scenario: str
     payment_nis: float
 
@@ -458,6 +479,8 @@ class PaymentSensitivity(BaseModel):
 class MixMetrics(BaseModel):
     """Metrics describing payments and risk for a candidate mix."""
 
+    model_config = ConfigDict(frozen=True)
+
     monthly_payment_nis: float
     pti_ratio: float
     pti_ratio_peak: float
@@ -490,6 +513,8 @@ class MixMetrics(BaseModel):
 class TermSweepEntry(BaseModel):
     """Summary metrics for a specific term length."""
 
+    model_config = ConfigDict(frozen=True)
+
     term_years: int
     monthly_payment_nis: float
     stress_payment_nis: float
@@ -501,6 +526,8 @@ class TermSweepEntry(BaseModel):
 class OptimizationCandidate(BaseModel):
     """A single mix candidate produced by the optimizer."""
 
+    model_config = ConfigDict(frozen=True)
+
     label: str
     shares: TrackShares
     metrics: MixMetrics
@@ -511,6 +538,8 @@ class OptimizationCandidate(BaseModel):
 class OptimizationResult(BaseModel):
     """Final optimizer output containing benchmarks and best-effort mix."""
 
+    model_config = ConfigDict(frozen=True)
+
     candidates: List[OptimizationCandidate]
     recommended_index: int
     engine_recommended_index: Optional[int] = None
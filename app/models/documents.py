@@ -5,12 +5,14 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DocumentKeyValue(BaseModel):
     """Represents a key-value pair extracted from a document."""
 
+    model_config = ConfigDict(frozen=True)
+
     key: str = ""
     value: str = ""
     confidence: Optional[float] = None
@@ -21,6 +23,8 @@ class DocumentKeyValue(BaseModel):
 class DocumentTableCell(BaseModel):
     """Represents a single cell inside an extracted table."""
 
+    model_config = ConfigDict(frozen=True)
+
     row_index: int = Field(ge=0)
     column_index: int = Field(ge=0)
     content: str = ""
@@ -29,6 +33,8 @@ class DocumentTableCell(BaseModel):
 class DocumentTable(BaseModel):
     """Represents a summary of a detected table."""
 
+    model_config = ConfigDict(frozen=True)
+
     row_count: Optional[int] = Field(default=None, ge=0)
     column_count: Optional[int] = Field(default=None, ge=0)
     rows: List[List[str]] = Field(default_factory=list)
@@ -38,6 +44,8 @@ class DocumentTable(BaseModel):
 class DocumentExtract(BaseModel):
     """Structured payload captured from OCR analysis."""
 
+    model_config = ConfigDict(frozen=True)
+
     locale: Optional[str] = None
     text_preview: Optional[str] = None
     text_truncated: bool = False
@@ -50,6 +58,8 @@ class DocumentExtract(BaseModel):
 class DocumentArtifact(BaseModel):
     """Persisted reference to an uploaded document."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     display_name: str
     original_filename: Optional[str] = None
@@ -51,6 +51,14 @@ class IntakeStore:
     def revisions(self) -> List[IntakeRevision]:
         return list(self._revisions)
 
+    def copy(self) -> "IntakeStore":
+        """Return a store with its own revision list.
+
+        Revisions are frozen and their records are private copies taken in
+        ``submit``, so they can be shared between stores.
+        """
+        return IntakeStore(list(self._revisions))
+
     def submit(self, submission: IntakeSubmission) -> IntakeRevision:
         version = self._revisions[-1].version + 1 if self._revisions else 1
         record = submission.record.model_copy(deep=True)
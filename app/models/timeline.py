@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class TimelineEventStatus(str, Enum):
@@ -44,7 +44,7 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TimelineDetail:
     label: str
     value: str
@@ -53,7 +53,7 @@ class TimelineDetail:
         return {"label": self.label, "value": self.value}
 
 
-@dataclass
+@dataclass(frozen=True)
 class TimelineEvent:
     id: str
     type: TimelineEventType
@@ -79,7 +79,13 @@ class TimelineEvent:
 
 @dataclass
 class TimelineState:
-    events: List[TimelineEvent] = field(default_factory=list)
+    """Timeline snapshot whose events are never mutated in place.
+
+    Updates rebind ``events`` to a new tuple, so a shallow copy of the state
+    can be handed out while the original keeps evolving.
+    """
+
+    events: Tuple[TimelineEvent, ...] = ()
     current_stage: Optional[TimelineStage] = None
     version: int = 0
 
@@ -94,26 +100,28 @@ class TimelineState:
         self.version += 1
 
     def clear(self) -> None:
-        self.events.clear()
+        self.events = ()
         self.current_stage = None
         self.version = 0
 
     def upsert_event(self, event: TimelineEvent) -> TimelineEvent:
+        events = list(self.events)
         index = next(
-            (i for i, existing in enumerate(self.events) if existing.id == event.id),
+            (i for i, existing in enumerate(events) if existing.id == event.id),
             None,
         )
 
         if event.status == TimelineEventStatus.ACTIVE:
-            for existing in self.events:
+            for i, existing in enumerate(events):
                 if existing.status == TimelineEventStatus.ACTIVE:
-                    existing.status = TimelineEventStatus.COMPLETED
+                    events[i] = replace(existing, status=TimelineEventStatus.COMPLETED)
             self.current_stage = event.stage
 
         if index is not None:
-            self.events[index] = event
+            events[index] = event
         else:
-            self.events.append(event)
+            events.append(event)
+        self.events = tuple(events)
 
         self._touch()
         return event
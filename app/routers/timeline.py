@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -23,8 +22,7 @@ async def timeline_snapshot(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    state = session.get_timeline()
-    return state.to_dict()
+    return session.get_timeline_payload()
 
 
 @router.get("/{session_id}/timeline/stream")
@@ -35,17 +33,17 @@ async def timeline_stream(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    queue = session.register_timeline_watcher()
+    watcher = session.register_timeline_watcher()
 
     async def event_source() -> AsyncGenerator[str, None]:
         try:
             while True:
-                payload = await queue.get()
-                yield f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                _, encoded = await watcher.get()
+                yield f"data: {encoded}\n\n"
         except asyncio.CancelledError:
             raise
         finally:
-            session.unregister_timeline_watcher(queue)
+            session.unregister_timeline_watcher(watcher)
 
     headers = {
         "Cache-Control": "no-cache",
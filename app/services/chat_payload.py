@@ -15,11 +15,7 @@ from ..models.chat_response import (
     OptimizationSummary,
     OptimizationTermSweepEntry,
 )
-from .optimization_formatter import (
-    format_candidates,
-    format_comparison_matrix,
-    format_term_sweep,
-)
+from .optimization_formatter import format_result, format_term_sweep
 
 
 def build_candidate_summary(item: dict[str, Any]) -> CandidateSummary:
@@ -128,10 +124,10 @@ def build_optimization_payload(
     if optimization_result is None:
         return [], [], None, None, None, None
 
-    candidate_payloads = format_candidates(optimization_result)
-    optimization_matrix = [
-        ComparisonRow(**row) for row in format_comparison_matrix(optimization_result)
-    ]
+    # The response models carry only numeric fields, so skip display strings.
+    formatted = format_result(optimization_result, include_display=False)
+    candidate_payloads = formatted["candidates"]
+    optimization_matrix = [ComparisonRow(**row) for row in formatted["comparison"]]
 
     candidate_models: List[CandidateSummary] = [
         build_candidate_summary(item) for item in candidate_payloads
@@ -20,6 +20,7 @@ from app.domain.schemas import (
 )
 from app.configuration import boi_limits
 from app.services.deal_feasibility import run_feasibility_checks
+from app.services.mortgage_math import monthly_payment
 
 BASE_ANCHOR_RATES: Dict[RateAnchor, float] = {
     RateAnchor.PRIME: 0.06,
@@ -167,14 +168,9 @@ def _build_rate_table(interview: InterviewRecord) -> Dict[str, float]:
 def _calculate_monthly_payment(
     loan_amount: float, term_years: int, annual_rate: float
 ) -> float:
-    monthly_rate = max(annual_rate, 0.0) / 12
-    months = max(term_years, 1) * 12
-    if monthly_rate <= 0:
-        return loan_amount / months
-    factor = (
-        monthly_rate * (1 + monthly_rate) ** months / ((1 + monthly_rate) ** months - 1)
+    return monthly_payment(
+        loan_amount, max(annual_rate, 0.0) / 12, max(term_years, 1) * 12
     )
-    return loan_amount * factor
 
 
 def _extract_prepayment_map(planning: PlanningContext) -> Dict[int, float]:
@@ -8,11 +8,78 @@ source weighting.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 from app.configuration import boi_limits
 from app.domain.schemas import DealType, OccupancyIntent, PropertyType
+from app.services.mortgage_math import annuity_factor, monthly_payment
+
+# Violation/warning codes are rendered to Hebrew only when a caller reads them.
+_MESSAGES: Dict[str, str] = {
+    "equity_shortfall": "חסר הון עצמי של כ-{shortfall:,.0f} ₪ כדי לעמוד בגובה המימון המותר.",
+    "pti_exceeds_cap": "ההחזר החודשי ({payment:,.0f} ₪) מעלה את יחס ההחזר ל-{pti:.1%}, מעבר לתקרת {cap:.0%} המותרת.",
+    "pti_elevated_risk": "יחס ההחזר {pti:.1%} גבוה מ-40%, ולכן הבנק יסווג את ההלוואה כבעלת סיכון מוגבר.",
+    "ltv_exceeds_limit": "שיעור המימון {ltv:.0%} גבוה מהמותר ({limit:.0%}) עבור סוג העסקה.",
+    "variable_share_exceeds_limit": "החשיפה לריבית משתנה ({share:.1%}) חורגת מן התקרה ‎{cap:.0%}.",
+    "term_exceeds_limit": "תקופת ההלוואה המבוקשת ({years} שנים) חורגת מהמקסימום ‎{max_years} שנים.",
+    "refinance_pti_increase": "מיחזור ההלוואה מגדיל את יחס ההחזר ביחס להלוואה הקיימת (329 §9).",
+    "refinance_ltv_increase": "מיחזור ההלוואה מגדיל את שיעור המימון ביחס להלוואה הקיימת (329 §9).",
+    "refinance_variable_share_increase": "מיחזור ההלוואה מגדיל את רכיב הריבית המשתנה ביחס לקיים (329 §9).",
+}
+_ELIGIBLE_NOTE = "הבקשה עומדת במגבלות הרגולטוריות הידועות."
+
+NoteCode = Tuple[str, Mapping[str, Any]]
+_NO_PARAMS: Mapping[str, Any] = {}
+# Shared empty buffer for results that raised no warning/exception.
+_NO_ENTRIES: Tuple[Any, ...] = ()
+
+
+def render_notes(codes: Sequence[NoteCode]) -> List[str]:
+    """Format violation/warning codes into their Hebrew messages."""
+    return [_MESSAGES[code].format(**params) for code, params in codes]
+
+
+def _lookup_ltv_limit(
+    property_type: PropertyType, deal_type: Optional[DealType]
+) -> float:
+    if deal_type is not None:
+        limit = boi_limits.LTV_LIMITS_BY_DEAL.get(deal_type)
+        if limit is not None:
+            return limit
+    return boi_limits.LTV_LIMITS_BY_PROPERTY.get(property_type, 0.0)
+
+
+# LTV ceilings resolved once for every (property, deal) combination.
+_LTV_LIMIT_TABLE: Dict[Tuple[PropertyType, Optional[DealType]], float] = {
+    (property_type, deal_type): _lookup_ltv_limit(property_type, deal_type)
+    for property_type in PropertyType
+    for deal_type in (None, *DealType)
+}
+
+# Directive 329 constants bound once for the evaluation hot path.
+_APPRAISAL_CAP_NIS = boi_limits.BUYER_PRICE_APPRAISAL_CAP_NIS
+_PTI_REGULATORY_LIMIT = boi_limits.PTI_REGULATORY_LIMIT
+_PTI_WARNING_THRESHOLD = boi_limits.PTI_WARNING_THRESHOLD
+_PTI_RENT_DEDUCTION = boi_limits.PTI_OCCUPANCY_RENT_DEDUCTION
+_VARIABLE_SHARE_LIMIT = boi_limits.VARIABLE_SHARE_LIMIT
+_MAX_BRIDGE_TERM_MONTHS = boi_limits.VARIABLE_SHARE_EXCEPTIONS.max_bridge_term_months
+_ANY_PURPOSE_EXCEPTION_NIS = boi_limits.VARIABLE_SHARE_EXCEPTIONS.any_purpose_amount_nis
+_MAX_TERM_YEARS = boi_limits.MAX_TERM_YEARS
+
+
+class _RawEvaluation(NamedTuple):
+    pti_cap: float
+    max_monthly_payment: float
+    ltv_limit: float
+    ltv_value_basis: float
+    max_loan_amount: float
+    required_down_payment: float
+    actual_monthly_payment: float
+    actual_pti: float
+    peak_pti: float
+    actual_ltv: float
 
 
 class RiskProfile:
@@ -23,7 +90,7 @@ class RiskProfile:
     AGGRESSIVE = "aggressive"
 
 
-@dataclass
+@dataclass(slots=True)
 class MortgageEligibilityResult:
     """Snapshot of an eligibility evaluation."""
 
@@ -34,14 +101,26 @@ class MortgageEligibilityResult:
     loan_to_value_ratio: float
     total_property_price: float
     is_eligible: bool
-    eligibility_notes: str
     assessed_monthly_payment: float = 0.0
-    pti_limit_applied: float = boi_limits.PTI_REGULATORY_LIMIT
+    pti_limit_applied: float = _PTI_REGULATORY_LIMIT
     peak_debt_to_income_ratio: float = 0.0
     ltv_value_basis: float = 0.0
-    violations: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-    applied_exceptions: List[str] = field(default_factory=list)
+    violation_codes: Sequence[NoteCode] = _NO_ENTRIES
+    warning_codes: Sequence[NoteCode] = _NO_ENTRIES
+    applied_exceptions: Sequence[str] = _NO_ENTRIES
+
+    @property
+    def violations(self) -> List[str]:
+        return render_notes(self.violation_codes)
+
+    @property
+    def warnings(self) -> List[str]:
+        return render_notes(self.warning_codes)
+
+    @property
+    def eligibility_notes(self) -> str:
+        notes = render_notes([*self.violation_codes, *self.warning_codes])
+        return " | ".join(notes) if notes else _ELIGIBLE_NOTE
 
 
 class MortgageEligibilityEvaluator:
@@ -53,6 +132,11 @@ class MortgageEligibilityEvaluator:
         RiskProfile.STANDARD: 0.33,
         RiskProfile.AGGRESSIVE: 0.40,
     }
+    # Risk presets already clamped to the regulatory PTI ceiling.
+    _EFFECTIVE_PTI_BY_RISK: Dict[str, float] = {
+        key: min(limit, _PTI_REGULATORY_LIMIT)
+        for key, limit in RISK_PROFILE_PTI_LIMITS.items()
+    }
 
     @staticmethod
     def _calculate_monthly_payment(
@@ -61,24 +145,16 @@ class MortgageEligibilityEvaluator:
         """Calculate monthly payment using mortgage formula."""
         if loan_amount <= 0 or months <= 0:
             return 0.0
-        if monthly_rate <= 0:
-            return loan_amount / months
-        factor = (
-            monthly_rate
-            * (1 + monthly_rate) ** months
-            / ((1 + monthly_rate) ** months - 1)
-        )
-        return loan_amount * factor
+        return monthly_payment(loan_amount, monthly_rate, months)
 
     @classmethod
     def _resolve_ltv_limit(
         cls, property_type: PropertyType, deal_type: Optional[DealType]
     ) -> float:
-        if deal_type is not None:
-            limit = boi_limits.LTV_LIMITS_BY_DEAL.get(deal_type)
-            if limit is not None:
-                return limit
-        return boi_limits.LTV_LIMITS_BY_PROPERTY.get(property_type, 0.0)
+        limit = _LTV_LIMIT_TABLE.get((property_type, deal_type))
+        if limit is None:
+            return _lookup_ltv_limit(property_type, deal_type)
+        return limit
 
     @classmethod
     def _buyer_price_value_basis(
@@ -90,49 +166,36 @@ class MortgageEligibilityEvaluator:
     ) -> float:
         if not is_reduced_price_dwelling or appraised_value_nis is None:
             return purchase_price
-        if appraised_value_nis <= boi_limits.BUYER_PRICE_APPRAISAL_CAP_NIS:
+        if appraised_value_nis <= _APPRAISAL_CAP_NIS:
             return appraised_value_nis
-        return max(boi_limits.BUYER_PRICE_APPRAISAL_CAP_NIS, purchase_price)
+        return max(_APPRAISAL_CAP_NIS, purchase_price)
 
     @classmethod
-    def evaluate(
+    def _compute_raw(
         cls,
         *,
         monthly_net_income: float,
         property_price: float,
         down_payment_available: float,
-        property_type: PropertyType = PropertyType.SINGLE,
-        deal_type: DealType = DealType.FIRST_HOME,
-        risk_profile: str = RiskProfile.STANDARD,
-        occupancy: OccupancyIntent = OccupancyIntent.OWN,
-        existing_loans_payment: float = 0.0,
-        other_housing_payments: float = 0.0,
-        loan_term_years: int = 25,
-        monthly_payment_override: Optional[float] = None,
-        peak_payment_override: Optional[float] = None,
-        variable_share_ratio: Optional[float] = None,
-        is_bridge_loan: bool = False,
-        bridge_term_months: Optional[int] = None,
-        any_purpose_amount_nis: Optional[float] = None,
-        is_refinance: bool = False,
-        previous_pti_ratio: Optional[float] = None,
-        previous_ltv_ratio: Optional[float] = None,
-        previous_variable_share_ratio: Optional[float] = None,
-        is_reduced_price_dwelling: bool = False,
-        appraised_value_nis: Optional[float] = None,
-        borrower_rent_expense: float = 0.0,
-    ) -> MortgageEligibilityResult:
-        """Evaluate mortgage eligibility against Directive 329 red lines."""
+        property_type: PropertyType,
+        deal_type: Optional[DealType],
+        risk_profile: str,
+        occupancy: OccupancyIntent,
+        existing_loans_payment: float,
+        other_housing_payments: float,
+        loan_term_years: int,
+        monthly_payment_override: Optional[float],
+        peak_payment_override: Optional[float],
+        is_reduced_price_dwelling: bool,
+        appraised_value_nis: Optional[float],
+        borrower_rent_expense: float,
+    ) -> _RawEvaluation:
+        """Numeric core shared by `evaluate` and `evaluate_fast`."""
 
-        risk_pti_limit = cls.RISK_PROFILE_PTI_LIMITS.get(
-            risk_profile, boi_limits.PTI_REGULATORY_LIMIT
-        )
-        pti_cap = min(risk_pti_limit, boi_limits.PTI_REGULATORY_LIMIT)
+        pti_cap = cls._EFFECTIVE_PTI_BY_RISK.get(risk_profile, _PTI_REGULATORY_LIMIT)
 
         rent_deduction = (
-            borrower_rent_expense
-            if boi_limits.PTI_OCCUPANCY_RENT_DEDUCTION.get(occupancy, False)
-            else 0.0
+            borrower_rent_expense if _PTI_RENT_DEDUCTION.get(occupancy, False) else 0.0
         )
         disposable_income = max(monthly_net_income - rent_deduction, 0.0)
         other_housing = max(other_housing_payments, 0.0)
@@ -165,11 +228,9 @@ class MortgageEligibilityEvaluator:
                 actual_loan_amount * max_monthly_payment / monthly_payment_override
             )
         else:
-            if monthly_rate > 0:
-                annuity_factor = (1 - (1 + monthly_rate) ** -months) / monthly_rate
-                max_loan_by_payment = max_monthly_payment * annuity_factor
-            else:
-                max_loan_by_payment = max_monthly_payment * months
+            max_loan_by_payment = max_monthly_payment * annuity_factor(
+                monthly_rate, months
+            )
 
         max_loan_amount = min(max_loan_by_payment, max_loan_by_ltv)
         required_down_payment = max(property_price - max_loan_amount, 0.0)
@@ -194,64 +255,191 @@ class MortgageEligibilityEvaluator:
             (actual_loan_amount / ltv_value_basis) if ltv_value_basis > 0 else 0.0
         )
 
-        violations: List[str] = []
-        warnings: List[str] = []
-        applied_exceptions: List[str] = []
+        return _RawEvaluation(
+            pti_cap=pti_cap,
+            max_monthly_payment=max_monthly_payment,
+            ltv_limit=ltv_limit,
+            ltv_value_basis=ltv_value_basis,
+            max_loan_amount=max_loan_amount,
+            required_down_payment=required_down_payment,
+            actual_monthly_payment=actual_monthly_payment,
+            actual_pti=actual_pti,
+            peak_pti=peak_pti,
+            actual_ltv=actual_ltv,
+        )
+
+    @classmethod
+    def evaluate_fast(
+        cls,
+        *,
+        monthly_net_income: float,
+        property_price: float,
+        down_payment_available: float,
+        property_type: PropertyType = PropertyType.SINGLE,
+        deal_type: DealType = DealType.FIRST_HOME,
+        risk_profile: str = RiskProfile.STANDARD,
+        occupancy: OccupancyIntent = OccupancyIntent.OWN,
+        existing_loans_payment: float = 0.0,
+        other_housing_payments: float = 0.0,
+        loan_term_years: int = 25,
+        borrower_rent_expense: float = 0.0,
+    ) -> Tuple[bool, float, float, float]:
+        """Return ``(is_eligible, pti, ltv, max_loan_amount)`` without building notes.
+
+        Covers plain purchase scenarios only: no payment overrides, variable-share
+        exposure or refinance inputs, so those checks never apply here.
+        """
+
+        raw = cls._compute_raw(
+            monthly_net_income=monthly_net_income,
+            property_price=property_price,
+            down_payment_available=down_payment_available,
+            property_type=property_type,
+            deal_type=deal_type,
+            risk_profile=risk_profile,
+            occupancy=occupancy,
+            existing_loans_payment=existing_loans_payment,
+            other_housing_payments=other_housing_payments,
+            loan_term_years=loan_term_years,
+            monthly_payment_override=None,
+            peak_payment_override=None,
+            is_reduced_price_dwelling=False,
+            appraised_value_nis=None,
+            borrower_rent_expense=borrower_rent_expense,
+        )
+        is_eligible = not (
+            down_payment_available + 1e-6 < raw.required_down_payment
+            or raw.actual_pti > raw.pti_cap + 1e-6
+            or raw.actual_ltv > raw.ltv_limit + 1e-6
+            or loan_term_years > _MAX_TERM_YEARS
+        )
+        return is_eligible, raw.actual_pti, raw.actual_ltv, raw.max_loan_amount
+
+    @classmethod
+    def evaluate(
+        cls,
+        *,
+        monthly_net_income: float,
+        property_price: float,
+        down_payment_available: float,
+        property_type: PropertyType = PropertyType.SINGLE,
+        deal_type: DealType = DealType.FIRST_HOME,
+        risk_profile: str = RiskProfile.STANDARD,
+        occupancy: OccupancyIntent = OccupancyIntent.OWN,
+        existing_loans_payment: float = 0.0,
+        other_housing_payments: float = 0.0,
+        loan_term_years: int = 25,
+        monthly_payment_override: Optional[float] = None,
+        peak_payment_override: Optional[float] = None,
+        variable_share_ratio: Optional[float] = None,
+        is_bridge_loan: bool = False,
+        bridge_term_months: Optional[int] = None,
+        any_purpose_amount_nis: Optional[float] = None,
+        is_refinance: bool = False,
+        previous_pti_ratio: Optional[float] = None,
+        previous_ltv_ratio: Optional[float] = None,
+        previous_variable_share_ratio: Optional[float] = None,
+        is_reduced_price_dwelling: bool = False,
+        appraised_value_nis: Optional[float] = None,
+        borrower_rent_expense: float = 0.0,
+    ) -> MortgageEligibilityResult:
+        """Evaluate mortgage eligibility against Directive 329 red lines."""
+
+        (
+            pti_cap,
+            max_monthly_payment,
+            ltv_limit,
+            ltv_value_basis,
+            max_loan_amount,
+            required_down_payment,
+            actual_monthly_payment,
+            actual_pti,
+            peak_pti,
+            actual_ltv,
+        ) = cls._compute_raw(
+            monthly_net_income=monthly_net_income,
+            property_price=property_price,
+            down_payment_available=down_payment_available,
+            property_type=property_type,
+            deal_type=deal_type,
+            risk_profile=risk_profile,
+            occupancy=occupancy,
+            existing_loans_payment=existing_loans_payment,
+            other_housing_payments=other_housing_payments,
+            loan_term_years=loan_term_years,
+            monthly_payment_override=monthly_payment_override,
+            peak_payment_override=peak_payment_override,
+            is_reduced_price_dwelling=is_reduced_price_dwelling,
+            appraised_value_nis=appraised_value_nis,
+            borrower_rent_expense=borrower_rent_expense,
+        )
+
+        violations: List[NoteCode] = []
+        warnings: Sequence[NoteCode] = _NO_ENTRIES
+        applied_exceptions: Sequence[str] = _NO_ENTRIES
 
         if down_payment_available + 1e-6 < required_down_payment:
             shortfall = required_down_payment - down_payment_available
-            violations.append(
-                f"חסר הון עצמי של כ-{shortfall:,.0f} ₪ כדי לעמוד בגובה המימון המותר."
-            )
+            violations.append(("equity_shortfall", {"shortfall": shortfall}))
 
         if actual_pti > pti_cap + 1e-6:
             violations.append(
-                f"ההחזר החודשי ({actual_monthly_payment:,.0f} ₪) מעלה את יחס ההחזר ל-{actual_pti:.1%}, מעבר לתקרת {pti_cap:.0%} המותרת."
-            )
-        elif actual_pti > boi_limits.PTI_WARNING_THRESHOLD + 1e-6:
-            warnings.append(
-                f"יחס ההחזר {actual_pti:.1%} גבוה מ-40%, ולכן הבנק יסווג את ההלוואה כבעלת סיכון מוגבר."
+                (
+                    "pti_exceeds_cap",
+                    {
+                        "payment": actual_monthly_payment,
+                        "pti": actual_pti,
+                        "cap": pti_cap,
+                    },
+                )
             )
+        elif actual_pti > _PTI_WARNING_THRESHOLD + 1e-6:
+            warnings = [("pti_elevated_risk", {"pti": actual_pti})]
 
         if actual_ltv > ltv_limit + 1e-6:
             violations.append(
-                f"שיעור המימון {actual_ltv:.0%} גבוה מהמותר ({ltv_limit:.0%}) עבור סוג העסקה."
+                ("ltv_exceeds_limit", {"ltv": actual_ltv, "limit": ltv_limit})
             )
 
         # Variable share cap (Directive 329 §7, §12 exceptions)
         variable_share = (
             variable_share_ratio if variable_share_ratio is not None else 0.0
         )
-        variable_cap = boi_limits.VARIABLE_SHARE_LIMIT
+        variable_cap = _VARIABLE_SHARE_LIMIT
         variable_within_limit = variable_share <= variable_cap + 1e-6
 
         if not variable_within_limit:
             exception_applied = False
             if is_bridge_loan and bridge_term_months is not None:
-                if (
-                    bridge_term_months
-                    <= boi_limits.VARIABLE_SHARE_EXCEPTIONS.max_bridge_term_months
-                ):
+                if bridge_term_months <= _MAX_BRIDGE_TERM_MONTHS:
                     exception_applied = True
-                    applied_exceptions.append("bridge_loan_exception_under_36_months")
+                    applied_exceptions = ["bridge_loan_exception_under_36_months"]
             if (
                 not exception_applied
                 and any_purpose_amount_nis is not None
-                and any_purpose_amount_nis
-                <= boi_limits.VARIABLE_SHARE_EXCEPTIONS.any_purpose_amount_nis + 1e-6
+                and any_purpose_amount_nis <= _ANY_PURPOSE_EXCEPTION_NIS + 1e-6
             ):
                 exception_applied = True
-                applied_exceptions.append("any_purpose_loan_exception_under_120k_nis")
+                applied_exceptions = ["any_purpose_loan_exception_under_120k_nis"]
 
             if not exception_applied:
                 violations.append(
-                    f"החשיפה לריבית משתנה ({variable_share * 100:.1f}%) חורגת מן התקרה ‎{variable_cap * 100:.0f}%."
+                    (
+                        "variable_share_exceeds_limit",
+                        {"share": variable_share, "cap": variable_cap},
+                    )
                 )
 
         # Term ceiling
-        if loan_term_years > boi_limits.MAX_TERM_YEARS:
+        if loan_term_years > _MAX_TERM_YEARS:
             violations.append(
-                f"תקופת ההלוואה המבוקשת ({loan_term_years} שנים) חורגת מהמקסימום ‎{boi_limits.MAX_TERM_YEARS} שנים."
+                (
+                    "term_exceeds_limit",
+                    {
+                        "years": loan_term_years,
+                        "max_years": _MAX_TERM_YEARS,
+                    },
+                )
             )
 
         # Refinance may not worsen ratios (§329 §9)
@@ -260,29 +448,17 @@ class MortgageEligibilityEvaluator:
                 previous_pti_ratio is not None
                 and actual_pti > previous_pti_ratio + 1e-6
             ):
-                violations.append(
-                    "מיחזור ההלוואה מגדיל את יחס ההחזר ביחס להלוואה הקיימת (329 §9)."
-                )
+                violations.append(("refinance_pti_increase", _NO_PARAMS))
             if (
                 previous_ltv_ratio is not None
                 and actual_ltv > previous_ltv_ratio + 1e-6
             ):
-                violations.append(
-                    "מיחזור ההלוואה מגדיל את שיעור המימון ביחס להלוואה הקיימת (329 §9)."
-                )
+                violations.append(("refinance_ltv_increase", _NO_PARAMS))
             if (
                 previous_variable_share_ratio is not None
                 and variable_share > previous_variable_share_ratio + 1e-6
             ):
-                violations.append(
-                    "מיחזור ההלוואה מגדיל את רכיב הריבית המשתנה ביחס לקיים (329 §9)."
-                )
-
-        notes: List[str] = []
-        notes.extend(violations)
-        notes.extend(warnings)
-        if not violations and not warnings:
-            notes.append("הבקשה עומדת במגבלות הרגולטוריות הידועות.")
+                violations.append(("refinance_variable_share_increase", _NO_PARAMS))
 
         is_eligible = not violations
 
@@ -294,16 +470,45 @@ class MortgageEligibilityEvaluator:
             loan_to_value_ratio=actual_ltv,
             total_property_price=property_price,
             is_eligible=is_eligible,
-            eligibility_notes=" | ".join(notes),
             assessed_monthly_payment=actual_monthly_payment,
             pti_limit_applied=pti_cap,
             peak_debt_to_income_ratio=peak_pti,
             ltv_value_basis=ltv_value_basis,
-            violations=violations,
-            warnings=warnings,
+            violation_codes=violations,
+            warning_codes=warnings,
             applied_exceptions=applied_exceptions,
         )
 
+    @classmethod
+    def _max_qualifying_price(
+        cls,
+        *,
+        monthly_net_income: float,
+        down_payment_available: float,
+        property_type: PropertyType,
+        deal_type: DealType,
+        existing_loans_payment: float,
+        other_housing_payments: float,
+        loan_term_years: int = 25,
+    ) -> float:
+        """Highest whole-shekel price that satisfies both the LTV and PTI caps."""
+
+        equity = max(down_payment_available, 0.0)
+        ltv_limit = cls._resolve_ltv_limit(property_type, deal_type)
+        max_monthly_payment = max(
+            max(monthly_net_income, 0.0)
+            * cls._EFFECTIVE_PTI_BY_RISK[RiskProfile.STANDARD]
+            - max(existing_loans_payment, 0.0)
+            - max(other_housing_payments, 0.0),
+            0.0,
+        )
+        # price - equity <= ltv_limit * price  and  price - equity <= payment capacity
+        ltv_bound = equity / (1 - ltv_limit) if ltv_limit < 1 else math.inf
+        pti_bound = equity + max_monthly_payment * annuity_factor(
+            cls.DEFAULT_INTEREST_RATE_ANNUAL / 12, max(loan_term_years, 1) * 12
+        )
+        return float(math.floor(min(ltv_bound, pti_bound)))
+
     @classmethod
     def adjustments_to_qualify(
         cls,
@@ -318,14 +523,37 @@ class MortgageEligibilityEvaluator:
     ) -> Dict[str, float]:
         """Suggest minimum adjustments to reach compliance (heuristic)."""
 
+        base_eligible, _, _, base_max_loan = cls.evaluate_fast(
+            monthly_net_income=monthly_net_income,
+            property_price=property_price,
+            down_payment_available=down_payment_available,
+            property_type=property_type,
+            deal_type=deal_type,
+            existing_loans_payment=existing_loans_payment,
+            other_housing_payments=other_housing_payments,
+        )
+
+        required_down_payment = max(property_price - base_max_loan, 0.0)
         scenarios: Dict[str, float] = {}
 
-        for price_reduction in [0, 50_000, 100_000, 200_000, 300_000]:
-            adjusted_price = property_price - price_reduction
-            if adjusted_price <= 0:
-                continue
+        # The unadjusted inputs already qualify: every sweep stops at step zero.
+        if base_eligible:
+            if property_price > 0:
+                scenarios["reduce_price"] = property_price
+            scenarios["required_down_payment"] = required_down_payment
+            scenarios["required_income"] = monthly_net_income
+            return scenarios
 
-            calc = cls.evaluate(
+        adjusted_price = cls._max_qualifying_price(
+            monthly_net_income=monthly_net_income,
+            down_payment_available=down_payment_available,
+            property_type=property_type,
+            deal_type=deal_type,
+            existing_loans_payment=existing_loans_payment,
+            other_housing_payments=other_housing_payments,
+        )
+        if 0 < adjusted_price < property_price:
+            eligible, _, _, _ = cls.evaluate_fast(
                 monthly_net_income=monthly_net_income,
                 property_price=adjusted_price,
                 down_payment_available=down_payment_available,
@@ -334,25 +562,14 @@ class MortgageEligibilityEvaluator:
                 existing_loans_payment=existing_loans_payment,
                 other_housing_payments=other_housing_payments,
             )
-
-            if calc.is_eligible:
+            if eligible:
                 scenarios["reduce_price"] = adjusted_price
-                break
 
-        calc = cls.evaluate(
-            monthly_net_income=monthly_net_income,
-            property_price=property_price,
-            down_payment_available=down_payment_available,
-            property_type=property_type,
-            deal_type=deal_type,
-            existing_loans_payment=existing_loans_payment,
-            other_housing_payments=other_housing_payments,
-        )
-        scenarios["required_down_payment"] = calc.required_down_payment
+        scenarios["required_down_payment"] = required_down_payment
 
-        for income_increase in range(0, 20_000, 1_000):
+        for income_increase in range(1_000, 20_000, 1_000):
             adjusted_income = monthly_net_income + income_increase
-            calc = cls.evaluate(
+            eligible, _, _, _ = cls.evaluate_fast(
                 monthly_net_income=adjusted_income,
                 property_price=property_price,
                 down_payment_available=down_payment_available,
@@ -362,7 +579,7 @@ class MortgageEligibilityEvaluator:
                 other_housing_payments=other_housing_payments,
             )
 
-            if calc.is_eligible:
+            if eligible:
                 scenarios["required_income"] = adjusted_income
                 break
 
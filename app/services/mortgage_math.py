@@ -0,0 +1,18 @@
+"""Shared annuity arithmetic for eligibility checks and mix optimization."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def annuity_factor(monthly_rate: float, months: int) -> float:
+    """Present value of a 1 NIS monthly payment stream (cached per rate/term)."""
+    if monthly_rate <= 0:
+        return float(months)
+    return (1 - (1 + monthly_rate) ** -months) / monthly_rate
+
+
+def monthly_payment(loan_amount: float, monthly_rate: float, months: int) -> float:
+    """Level monthly payment that amortizes ``loan_amount`` over ``months``."""
+    return loan_amount / annuity_factor(monthly_rate, months)
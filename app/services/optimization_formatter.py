@@ -2,17 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterator, List
 
-from app.domain.schemas import OptimizationCandidate, OptimizationResult, TermSweepEntry
+from app.domain.schemas import (
+    MixMetrics,
+    OptimizationCandidate,
+    OptimizationResult,
+    TermSweepEntry,
+)
 
+# Bound ``str.format`` methods: one C call per field, no Python frame.
+_format_currency: Callable[[float], str] = "{:,.0f}".format
+_format_pct: Callable[[float], str] = "{:.1f}%".format
+_format_ratio_pct: Callable[[float], str] = "{:.1%}".format
 
-def _format_currency(value: float) -> str:
-    return f"{value:,.0f}"
-
-
-def _format_pct(value: float) -> str:
-    return f"{value:.1f}%"
+_TRACK_DETAIL_KEYS = (
+    "track",
+    "amount_nis",
+    "rate_display",
+    "indexation",
+    "reset_note",
+    "anchor_rate_pct",
+)
+_FEASIBILITY_KEYS = (
+    "is_feasible",
+    "ltv_ratio",
+    "ltv_limit",
+    "pti_ratio",
+    "pti_ratio_peak",
+    "pti_limit",
+    "variable_share_pct",
+    "variable_share_limit_pct",
+    "loan_term_years",
+    "loan_term_limit_years",
+)
+# Pydantic keeps validated field values in the instance ``__dict__``; reading
+# them with ``itemgetter`` skips per-field attribute resolution.
+_track_detail_values = itemgetter(*_TRACK_DETAIL_KEYS)
+_feasibility_values = itemgetter(*_FEASIBILITY_KEYS)
+_issue_code = attrgetter("code")
 
 
 def _share_percentages(candidate: OptimizationCandidate) -> Dict[str, float]:
@@ -25,74 +54,97 @@ def _share_percentages(candidate: OptimizationCandidate) -> Dict[str, float]:
     }
 
 
-def _metrics_snapshot(candidate: OptimizationCandidate) -> Dict[str, Any]:
+def _comparison_fields(
+    metrics: MixMetrics, include_display: bool = True
+) -> Dict[str, Any]:
+    """Metric columns shared by candidate snapshots and the comparison matrix."""
+
+    monthly_payment = metrics.monthly_payment_nis
+    highest_payment = metrics.highest_expected_payment_nis
+    delta_peak_payment = highest_payment - monthly_payment
+    pti_ratio = metrics.pti_ratio
+    pti_ratio_peak = metrics.pti_ratio_peak
+    variable_share = metrics.variable_share_pct
+    cpi_share = metrics.cpi_share_pct
+    five_year_total = metrics.five_year_total_payment_nis
+    fields = {
+        "monthly_payment_nis": monthly_payment,
+        "highest_expected_payment_nis": highest_payment,
+        "delta_peak_payment_nis": delta_peak_payment,
+        "pti_ratio": pti_ratio,
+        "pti_ratio_peak": pti_ratio_peak,
+        "variable_share_pct": variable_share,
+        "cpi_share_pct": cpi_share,
+        "five_year_total_payment_nis": five_year_total,
+        "prepayment_fee_exposure": metrics.prepayment_fee_exposure,
+        "peak_payment_month": metrics.peak_payment_month,
+        "peak_payment_driver": metrics.peak_payment_driver,
+    }
+    if include_display:
+        fields.update(
+            monthly_payment_display=_format_currency(monthly_payment),
+            highest_expected_payment_display=_format_currency(highest_payment),
+            delta_peak_payment_display=_format_currency(delta_peak_payment),
+            pti_ratio_display=_format_ratio_pct(pti_ratio),
+            pti_ratio_peak_display=_format_ratio_pct(pti_ratio_peak),
+            variable_share_display=_format_pct(variable_share),
+            cpi_share_display=_format_pct(cpi_share),
+            five_year_total_payment_display=_format_currency(five_year_total),
+        )
+    return fields
+
+
+def _metrics_snapshot(
+    candidate: OptimizationCandidate,
+    shared: Dict[str, Any] | None = None,
+    include_display: bool = True,
+) -> Dict[str, Any]:
     metrics = candidate.metrics
-    delta_peak_payment = (
-        metrics.highest_expected_payment_nis - metrics.monthly_payment_nis
-    )
-    return {
-        "monthly_payment_nis": metrics.monthly_payment_nis,
-        "monthly_payment_display": _format_currency(metrics.monthly_payment_nis),
+    if shared is None:
+        shared = _comparison_fields(metrics, include_display)
+    stress_payment = metrics.max_payment_under_stress
+    future_pti_ratio = metrics.future_pti_ratio
+    future_pti_target = metrics.future_pti_target
+    ltv_ratio = metrics.ltv_ratio
+    snapshot = {
+        **shared,
         "expected_weighted_payment_nis": metrics.expected_weighted_payment_nis,
-        "highest_expected_payment_nis": metrics.highest_expected_payment_nis,
-        "highest_expected_payment_display": _format_currency(
-            metrics.highest_expected_payment_nis
-        ),
         "highest_expected_payment_note": metrics.highest_expected_payment_note,
-        "stress_payment_nis": metrics.max_payment_under_stress,
-        "stress_payment_display": _format_currency(metrics.max_payment_under_stress),
-        "delta_peak_payment_nis": delta_peak_payment,
-        "delta_peak_payment_display": _format_currency(delta_peak_payment),
-        "pti_ratio": metrics.pti_ratio,
-        "pti_ratio_display": _format_pct(metrics.pti_ratio * 100),
-        "pti_ratio_peak": metrics.pti_ratio_peak,
-        "pti_ratio_peak_display": _format_pct(metrics.pti_ratio_peak * 100),
+        "stress_payment_nis": stress_payment,
         "pti_ratio_peak_month": metrics.pti_ratio_peak_month,
-        "future_pti_ratio": metrics.future_pti_ratio,
-        "future_pti_ratio_display": (
-            _format_pct(metrics.future_pti_ratio * 100)
-            if metrics.future_pti_ratio is not None
-            else None
-        ),
+        "future_pti_ratio": future_pti_ratio,
         "future_pti_month": metrics.future_pti_month,
-        "future_pti_target": metrics.future_pti_target,
-        "future_pti_target_display": (
-            _format_pct(metrics.future_pti_target * 100)
-            if metrics.future_pti_target is not None
-            else None
-        ),
+        "future_pti_target": future_pti_target,
         "future_pti_breach": metrics.future_pti_breach,
-        "five_year_total_payment_nis": metrics.five_year_total_payment_nis,
-        "five_year_total_payment_display": _format_currency(
-            metrics.five_year_total_payment_nis
-        ),
         "total_weighted_cost_nis": metrics.total_weighted_cost_nis,
-        "variable_share_pct": metrics.variable_share_pct,
-        "variable_share_display": _format_pct(metrics.variable_share_pct),
-        "cpi_share_pct": metrics.cpi_share_pct,
-        "cpi_share_display": _format_pct(metrics.cpi_share_pct),
-        "ltv_ratio": metrics.ltv_ratio,
-        "ltv_ratio_display": _format_pct(metrics.ltv_ratio * 100),
-        "prepayment_fee_exposure": metrics.prepayment_fee_exposure,
-        "peak_payment_month": metrics.peak_payment_month,
-        "peak_payment_driver": metrics.peak_payment_driver,
+        "ltv_ratio": ltv_ratio,
         "payment_sensitivity": [
             {"scenario": item.scenario, "payment_nis": item.payment_nis}
             for item in metrics.payment_sensitivity
         ],
     }
+    if include_display:
+        snapshot.update(
+            stress_payment_display=_format_currency(stress_payment),
+            future_pti_ratio_display=(
+                _format_ratio_pct(future_pti_ratio)
+                if future_pti_ratio is not None
+                else None
+            ),
+            future_pti_target_display=(
+                _format_ratio_pct(future_pti_target)
+                if future_pti_target is not None
+                else None
+            ),
+            ltv_ratio_display=_format_ratio_pct(ltv_ratio),
+        )
+    return snapshot
 
 
 def _track_details_snapshot(candidate: OptimizationCandidate) -> List[Dict[str, Any]]:
+    keys, values = _TRACK_DETAIL_KEYS, _track_detail_values
     return [
-        {
-            "track": detail.track,
-            "amount_nis": detail.amount_nis,
-            "rate_display": detail.rate_display,
-            "indexation": detail.indexation,
-            "reset_note": detail.reset_note,
-            "anchor_rate_pct": detail.anchor_rate_pct,
-        }
+        dict(zip(keys, values(detail.__dict__)))
         for detail in candidate.metrics.track_details
     ]
 
@@ -101,86 +153,112 @@ def _feasibility_snapshot(candidate: OptimizationCandidate) -> Dict[str, Any] |
     feasibility = candidate.feasibility
     if feasibility is None:
         return None
+    snapshot = dict(zip(_FEASIBILITY_KEYS, _feasibility_values(feasibility.__dict__)))
+    issues = feasibility.issues
+    snapshot["issues"] = list(map(_issue_code, issues)) if issues else []
+    return snapshot
+
+
+def _recommended_indices(result: OptimizationResult) -> tuple[int, int]:
+    """Return ``(recommended, engine_recommended)`` with the engine fallback applied."""
+
+    recommended = result.recommended_index
+    engine = result.engine_recommended_index
+    return recommended, recommended if engine is None else engine
+
+
+def _candidate_summary(
+    index: int,
+    candidate: OptimizationCandidate,
+    metrics: Dict[str, Any],
+    recommended_index: int,
+    engine_index: int,
+) -> Dict[str, Any]:
     return {
-        "is_feasible": feasibility.is_feasible,
-        "ltv_ratio": feasibility.ltv_ratio,
-        "ltv_limit": feasibility.ltv_limit,
-        "pti_ratio": feasibility.pti_ratio,
-        "pti_ratio_peak": feasibility.pti_ratio_peak,
-        "pti_limit": feasibility.pti_limit,
-        "variable_share_pct": feasibility.variable_share_pct,
-        "variable_share_limit_pct": feasibility.variable_share_limit_pct,
-        "loan_term_years": feasibility.loan_term_years,
-        "loan_term_limit_years": feasibility.loan_term_limit_years,
-        "issues": [issue.code for issue in feasibility.issues],
+        "label": candidate.label,
+        "index": index,
+        "is_recommended": index == recommended_index,
+        "is_engine_recommended": index == engine_index,
+        "shares": _share_percentages(candidate),
+        "metrics": metrics,
+        "track_details": _track_details_snapshot(candidate),
+        "feasibility": _feasibility_snapshot(candidate),
+        # Candidates are frozen and their notes are never edited after build.
+        "notes": candidate.notes,
     }
 
 
-def format_candidates(result: OptimizationResult) -> List[Dict[str, Any]]:
-    """Return a presentation-friendly summary for each optimization candidate."""
+def _comparison_row(
+    index: int, candidate: OptimizationCandidate, include_display: bool = True
+) -> Dict[str, Any]:
+    return {
+        "label": candidate.label,
+        "index": index,
+        **_comparison_fields(candidate.metrics, include_display),
+    }
 
-    formatted: List[Dict[str, Any]] = []
+
+def iter_format_candidates(
+    result: OptimizationResult, *, include_display: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """Yield candidate summaries one at a time, e.g. for streamed responses."""
+
+    summary_fn, metrics_fn = _candidate_summary, _metrics_snapshot
+    rec_idx, engine_idx = _recommended_indices(result)
     for index, candidate in enumerate(result.candidates):
-        formatted.append(
-            {
-                "label": candidate.label,
-                "index": index,
-                "is_recommended": index == result.recommended_index,
-                "is_engine_recommended": index
-                == (
-                    result.engine_recommended_index
-                    if result.engine_recommended_index is not None
-                    else result.recommended_index
-                ),
-                "shares": _share_percentages(candidate),
-                "metrics": _metrics_snapshot(candidate),
-                "track_details": _track_details_snapshot(candidate),
-                "feasibility": _feasibility_snapshot(candidate),
-                "notes": list(candidate.notes),
-            }
+        yield summary_fn(
+            index,
+            candidate,
+            metrics_fn(candidate, None, include_display),
+            rec_idx,
+            engine_idx,
         )
-    return formatted
 
 
-def format_comparison_matrix(result: OptimizationResult) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
+def iter_format_comparison_matrix(
+    result: OptimizationResult, *, include_display: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """Yield comparison matrix rows one at a time."""
+
+    row_fn = _comparison_row
     for index, candidate in enumerate(result.candidates):
-        metrics = candidate.metrics
-        delta_peak_payment = (
-            metrics.highest_expected_payment_nis - metrics.monthly_payment_nis
-        )
-        rows.append(
-            {
-                "label": candidate.label,
-                "index": index,
-                "monthly_payment_nis": metrics.monthly_payment_nis,
-                "monthly_payment_display": _format_currency(
-                    metrics.monthly_payment_nis
-                ),
-                "highest_expected_payment_nis": metrics.highest_expected_payment_nis,
-                "highest_expected_payment_display": _format_currency(
-                    metrics.highest_expected_payment_nis
-                ),
-                "delta_peak_payment_nis": delta_peak_payment,
-                "delta_peak_payment_display": _format_currency(delta_peak_payment),
-                "pti_ratio": metrics.pti_ratio,
-                "pti_ratio_display": _format_pct(metrics.pti_ratio * 100),
-                "pti_ratio_peak": metrics.pti_ratio_peak,
-                "pti_ratio_peak_display": _format_pct(metrics.pti_ratio_peak * 100),
-                "variable_share_pct": metrics.variable_share_pct,
-                "variable_share_display": _format_pct(metrics.variable_share_pct),
-                "cpi_share_pct": metrics.cpi_share_pct,
-                "cpi_share_display": _format_pct(metrics.cpi_share_pct),
-                "five_year_total_payment_nis": metrics.five_year_total_payment_nis,
-                "five_year_total_payment_display": _format_currency(
-                    metrics.five_year_total_payment_nis
-                ),
-                "prepayment_fee_exposure": metrics.prepayment_fee_exposure,
-                "peak_payment_month": metrics.peak_payment_month,
-                "peak_payment_driver": metrics.peak_payment_driver,
-            }
+        yield row_fn(index, candidate, include_display)
+
+
+def format_candidates(
+    result: OptimizationResult, *, include_display: bool = True
+) -> List[Dict[str, Any]]:
+    """Return a presentation-friendly summary for each optimization candidate.
+
+    With ``include_display=False`` the pre-rendered ``*_display`` strings are
+    omitted, for callers that only consume the numeric fields.
+    """
+
+    return list(iter_format_candidates(result, include_display=include_display))
+
+
+def format_comparison_matrix(
+    result: OptimizationResult, *, include_display: bool = True
+) -> List[Dict[str, Any]]:
+    return list(iter_format_comparison_matrix(result, include_display=include_display))
+
+
+def format_result(
+    result: OptimizationResult, *, include_display: bool = True
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Build candidate summaries and comparison rows in a single pass."""
+
+    candidates: List[Dict[str, Any]] = []
+    comparison: List[Dict[str, Any]] = []
+    rec_idx, engine_idx = _recommended_indices(result)
+    for index, candidate in enumerate(result.candidates):
+        shared = _comparison_fields(candidate.metrics, include_display)
+        comparison.append({"label": candidate.label, "index": index, **shared})
+        metrics = _metrics_snapshot(candidate, shared, include_display)
+        candidates.append(
+            _candidate_summary(index, candidate, metrics, rec_idx, engine_idx)
         )
-    return rows
+    return {"candidates": candidates, "comparison": comparison}
 
 
 def format_term_sweep(entries: List[TermSweepEntry]) -> List[Dict[str, Any]]:
@@ -198,12 +276,19 @@ def format_term_sweep(entries: List[TermSweepEntry]) -> List[Dict[str, Any]]:
                     entry.expected_weighted_payment_nis
                 ),
                 "pti_ratio": entry.pti_ratio,
-                "pti_ratio_display": _format_pct(entry.pti_ratio * 100),
+                "pti_ratio_display": _format_ratio_pct(entry.pti_ratio),
                 "pti_ratio_peak": entry.pti_ratio_peak,
-                "pti_ratio_peak_display": _format_pct(entry.pti_ratio_peak * 100),
+                "pti_ratio_peak_display": _format_ratio_pct(entry.pti_ratio_peak),
             }
         )
     return formatted
 
 
-__all__ = ["format_candidates", "format_comparison_matrix", "format_term_sweep"]
+__all__ = [
+    "format_candidates",
+    "format_comparison_matrix",
+    "format_result",
+    "format_term_sweep",
+    "iter_format_candidates",
+    "iter_format_comparison_matrix",
+]
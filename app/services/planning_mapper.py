@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List
+from itertools import accumulate
+from operator import add
+from typing import Any, Dict, List
 
 from app.domain.schemas import (
     FuturePlan,
@@ -16,6 +18,9 @@ from app.domain.schemas import (
 )
 
 HORIZON_MONTHS = 60
+_UTC = timezone.utc
+# Life events that, when they cut income, also nudge expenses upward.
+_EXPENSE_BUMP_CATEGORIES = frozenset(("family", "education"))
 
 
 def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
@@ -73,13 +78,15 @@ def _compute_soft_caps(submission: IntakeSubmission) -> SoftCaps:
     )
 
 
+_BASE_SCENARIO_WEIGHTS = ScenarioWeights(fall=0.2, flat=0.6, rise=0.2)
+_SCENARIO_WEIGHTS = {
+    "fall": ScenarioWeights(fall=0.5, flat=0.3, rise=0.2),
+    "rise": ScenarioWeights(fall=0.2, flat=0.3, rise=0.5),
+}
+
+
 def _compute_scenario_weights(rate_view) -> ScenarioWeights:
-    base = ScenarioWeights(fall=0.2, flat=0.6, rise=0.2)
-    if rate_view == "fall":
-        return ScenarioWeights(fall=0.5, flat=0.3, rise=0.2)
-    if rate_view == "rise":
-        return ScenarioWeights(fall=0.2, flat=0.3, rise=0.5)
-    return base
+    return _SCENARIO_WEIGHTS.get(rate_view, _BASE_SCENARIO_WEIGHTS)
 
 
 def _baseline_income(submission: IntakeSubmission) -> float:
@@ -97,20 +104,26 @@ def _apply_future_plans(
     income_timeline: List[float],
     expense_timeline: List[float],
 ) -> None:
-    plans: List[FuturePlan] = submission.record.future_plans or []
+    plans: List[FuturePlan] = submission.record.future_plans
+    if not plans:
+        return
+    # Each plan shifts every month from its start onward, so record the step
+    # at the start month and apply all of them with one running sum.
+    horizon = HORIZON_MONTHS
+    income_steps = [0.0] * horizon
+    expense_steps = [0.0] * horizon
     for plan in plans:
         if plan.timeframe_months is None:
             continue
-        start = min(max(plan.timeframe_months, 0), HORIZON_MONTHS - 1)
+        start = min(max(plan.timeframe_months, 0), horizon - 1)
         confidence = plan.confidence if plan.confidence is not None else 1.0
         delta = (plan.expected_income_delta_nis or 0.0) * confidence
-        for month in range(start, HORIZON_MONTHS):
-            income_timeline[month] += delta
+        income_steps[start] += delta
         # heuristic: family/education events increase expenses slightly
-        if plan.category in {"family", "education"} and delta < 0:
-            extra_expense = abs(delta) * 0.25
-            for month in range(start, HORIZON_MONTHS):
-                expense_timeline[month] += extra_expense
+        if plan.category in _EXPENSE_BUMP_CATEGORIES and delta < 0:
+            expense_steps[start] += abs(delta) * 0.25
+    income_timeline[:] = map(add, income_timeline, accumulate(income_steps))
+    expense_timeline[:] = map(add, expense_timeline, accumulate(expense_steps))
 
 
 def _build_prepayment_schedule(submission: IntakeSubmission) -> List[PrepaymentEvent]:
@@ -131,8 +144,14 @@ def _build_prepayment_schedule(submission: IntakeSubmission) -> List[PrepaymentE
     return schedule
 
 
-def build_planning_context(submission: IntakeSubmission) -> PlanningContext:
-    """Convert a confirmed intake submission into a planning context."""
+def build_planning_context(
+    submission: IntakeSubmission, *, stamp_time: bool = True
+) -> PlanningContext:
+    """Convert a confirmed intake submission into a planning context.
+
+    Pass ``stamp_time=False`` for throwaway contexts (e.g. what-if sweeps) to
+    skip recording ``metadata["generated_at"]``.
+    """
 
     weights = _compute_weights(submission)
     soft_caps = _compute_soft_caps(submission)
@@ -143,30 +162,30 @@ def build_planning_context(submission: IntakeSubmission) -> PlanningContext:
     baseline_income = max(_baseline_income(submission), 0.0)
     baseline_expense = _baseline_expense(submission)
 
-    income_timeline = [baseline_income for _ in range(HORIZON_MONTHS)]
-    expense_timeline = [baseline_expense for _ in range(HORIZON_MONTHS)]
+    income_timeline = [baseline_income] * HORIZON_MONTHS
+    expense_timeline = [baseline_expense] * HORIZON_MONTHS
     _apply_future_plans(submission, income_timeline, expense_timeline)
 
     payment_ceiling = soft_caps.payment_ceiling_nis
-    pti_targets: List[float] = []
-    for month in range(HORIZON_MONTHS):
-        income = max(income_timeline[month], 1.0)
-        if payment_ceiling:
-            pti_targets.append(_clamp(payment_ceiling / income, 0.0, 1.0))
-        else:
-            pti_targets.append(0.5)
-
-    metadata = {
-        "horizon_months": HORIZON_MONTHS,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "assumptions": {
-            "baseline_income": baseline_income,
-            "baseline_expense": baseline_expense,
-            "soft_caps": {
-                "variable_share_max": soft_caps.variable_share_max,
-                "cpi_share_max": soft_caps.cpi_share_max,
-                "payment_ceiling_nis": soft_caps.payment_ceiling_nis,
-            },
+    pti_targets: List[float]
+    if payment_ceiling:
+        pti_targets = [
+            max(0.0, min(1.0, payment_ceiling / max(income, 1.0)))
+            for income in income_timeline
+        ]
+    else:
+        pti_targets = [0.5] * HORIZON_MONTHS
+
+    metadata: Dict[str, Any] = {"horizon_months": HORIZON_MONTHS}
+    if stamp_time:
+        metadata["generated_at"] = datetime.now(_UTC).isoformat()
+    metadata["assumptions"] = {
+        "baseline_income": baseline_income,
+        "baseline_expense": baseline_expense,
+        "soft_caps": {
+            "variable_share_max": soft_caps.variable_share_max,
+            "cpi_share_max": soft_caps.cpi_share_max,
+            "payment_ceiling_nis": soft_caps.payment_ceiling_nis,
         },
     }
 
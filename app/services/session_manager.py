@@ -4,11 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import json
 import logging
+import math
+import secrets
 import threading
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
 from typing import Any, Callable, Dict, Optional, Tuple, Iterable, cast
 
 from agents.items import TResponseInputItem
@@ -16,7 +23,7 @@ from agents.memory.session import SessionABC
 from pydantic import ValidationError
 
 from ..config import settings
-from ..db import SessionLocal, models
+from ..db import SessionLocal
 from ..domain.schemas import (
     IntakeSubmission,
     InterviewRecord,
@@ -42,10 +49,17 @@ from .session_repository import SessionRepository
 logger = logging.getLogger(__name__)
 
 TimelineUpdatePayload = Dict[str, Any]
-_cache_lock = threading.RLock()
-
-
-_LOCAL_TIMEZONE = datetime.now(timezone.utc).astimezone().tzinfo or timezone.utc
+# A timeline payload paired with its JSON encoding, shared by every watcher.
+TimelineUpdate = Tuple[TimelineUpdatePayload, str]
+_RepoWrite = Callable[[SessionRepository], None]
+# (write, commit future, coalescing key); see ``_coalesce_writes``.
+_PendingWrite = Tuple[_RepoWrite, "asyncio.Future[None]", Optional[str]]
+_TIMELINE_WRITE_KEY = "timeline"
+_cache_lock = threading.Lock()
+# Upper bound on queued writes per session; producers wait once it is reached.
+_MAX_PENDING_WRITES = 256
+# History appends that callers did not wait for, awaited by ``flush_pending_writes``.
+_background_writes: set["asyncio.Future[None]"] = set()
 
 
 def _utcnow() -> datetime:
@@ -53,17 +67,36 @@ def _utcnow() -> datetime:
 
 
 def _generate_session_id() -> str:
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    unique_part = uuid.uuid4().hex[:8]
-    return f"{settings.default_session_prefix}{timestamp}_{unique_part}"
+    # 96 random bits: collisions are not a practical concern, and if one ever
+    # happened upsert_session still refuses to hand over another user's row.
+    return f"{settings.default_session_prefix}{secrets.token_hex(12)}"
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
 
+def _clone_item(value: Any) -> Any:
+    """Copy a JSON-shaped conversation item, much cheaper than ``copy.deepcopy``."""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _clone_item(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone_item(item) for item in value]
+    if value_type in _JSON_SCALARS:
+        return value
+    return copy.deepcopy(value)
 
-def _ensure_utc(dt: datetime) -> datetime:
-    """Return a timezone-aware UTC datetime, coercing naive values if needed."""
-    if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
-        localized = dt.replace(tzinfo=_LOCAL_TIMEZONE)
-        return localized.astimezone(timezone.utc)
-    return dt.astimezone(timezone.utc)
+
+def _timeline_update(state: TimelineState) -> TimelineUpdate:
+    payload = state.to_dict()
+    return payload, json.dumps(payload, ensure_ascii=False)
+
+
+# Value -> member maps; a dict lookup is far cheaper than calling the Enum.
+# Unknown values raise KeyError, which the per-event guard below handles.
+_EVENT_TYPES = {member.value: member for member in TimelineEventType}
+_EVENT_STAGES = {member.value: member for member in TimelineStage}
+_EVENT_STATUSES = {member.value: member for member in TimelineEventStatus}
 
 
 def _timeline_from_dict(data: Dict[str, Any]) -> TimelineState:
@@ -74,13 +107,12 @@ def _timeline_from_dict(data: Dict[str, Any]) -> TimelineState:
     state.version = int(data.get("version", 0))
     stage_value = data.get("current_stage")
     if stage_value:
-        try:
-            state.current_stage = TimelineStage(stage_value)
-        except ValueError:
+        state.current_stage = _EVENT_STAGES.get(stage_value)
+        if state.current_stage is None:
             logger.warning("Unknown timeline stage stored: %s", stage_value)
-            state.current_stage = None
 
     events: list[TimelineEvent] = []
+    event_types, stages, statuses = _EVENT_TYPES, _EVENT_STAGES, _EVENT_STATUSES
     for raw in data.get("events", []):
         try:
             timestamp_raw = raw.get("timestamp")
@@ -95,13 +127,13 @@ def _timeline_from_dict(data: Dict[str, Any]) -> TimelineState:
             else:
                 timestamp_value = _utcnow()
             event = TimelineEvent(
-                id=str(raw.get("id", uuid.uuid4().hex)),
-                type=TimelineEventType(raw.get("type", TimelineEventType.UPDATE.value)),
+                # Only mint a fallback id when one is missing; a uuid4 per
+                # stored event is wasted work on every load.
+                id=str(raw["id"]) if "id" in raw else uuid.uuid4().hex,
+                type=event_types[raw.get("type", TimelineEventType.UPDATE.value)],
                 title=str(raw.get("title", "")),
-                stage=TimelineStage(raw.get("stage", TimelineStage.CONSULTATION.value)),
-                status=TimelineEventStatus(
-                    raw.get("status", TimelineEventStatus.PENDING.value)
-                ),
+                stage=stages[raw.get("stage", TimelineStage.CONSULTATION.value)],
+                status=statuses[raw.get("status", TimelineEventStatus.PENDING.value)],
                 description=raw.get("description"),
                 bank_name=raw.get("bankName") or raw.get("bank_name"),
                 timestamp=timestamp_value,
@@ -116,17 +148,17 @@ def _timeline_from_dict(data: Dict[str, Any]) -> TimelineState:
             events.append(event)
         except Exception as exc:  # pragma: no cover - defensive
             logger.warning("Failed to deserialize timeline event: %s", exc)
-    state.events = events
+    state.events = tuple(events)
     return state
 
 
 def _intake_store_from_records(
-    records: Iterable[models.SessionIntakeRevision],
+    records: Iterable[dict[str, Any]],
 ) -> IntakeStore:
     store = IntakeStore()
     revisions: list[IntakeRevision] = []
     for row in records:
-        payload = row.revision or {}
+        payload = row or {}
         record_data = payload.get("record")
         if not record_data:
             continue
@@ -167,43 +199,73 @@ def _document_extract_from_payload(
 
 
 def _documents_from_records(
-    records: Iterable[models.SessionDocumentArtifact],
+    records: Iterable[dict[str, Any]],
 ) -> dict[str, DocumentArtifact]:
     artifacts: dict[str, DocumentArtifact] = {}
     for row in records:
-        extract = _document_extract_from_payload(row.extract)
+        artifact_id = row["id"]
+        extract = _document_extract_from_payload(row.get("extract"))
         try:
             artifact = DocumentArtifact(
-                id=row.id,
-                display_name=row.display_name,
-                original_filename=row.original_filename,
-                mime_type=row.mime_type,
-                document_type=row.document_type or "unknown",
-                uploaded_at=row.uploaded_at or _utcnow(),
-                extracted_at=row.extracted_at,
+                id=artifact_id,
+                display_name=row["display_name"],
+                original_filename=row.get("original_filename"),
+                mime_type=row.get("mime_type"),
+                document_type=row.get("document_type") or "unknown",
+                uploaded_at=row.get("uploaded_at") or _utcnow(),
+                extracted_at=row.get("extracted_at"),
                 extract=extract,
             )
         except ValidationError as exc:
             logger.warning(
-                "Failed to deserialize document artifact %s: %s", row.id, exc
+                "Failed to deserialize document artifact %s: %s", artifact_id, exc
             )
             continue
-        artifacts[row.id] = artifact
+        artifacts[artifact_id] = artifact
     return artifacts
 
 
+def _coalesce_writes(batch: list[_PendingWrite]) -> list[_RepoWrite]:
+    """Drop keyed writes that a later write with the same key supersedes."""
+    last_index = {key: i for i, (_, _, key) in enumerate(batch) if key is not None}
+    return [
+        write
+        for i, (write, _, key) in enumerate(batch)
+        if key is None or last_index[key] == i
+    ]
+
+
+class TimelineWatcher:
+    """Latest-value slot feeding one timeline stream.
+
+    Every update carries the whole timeline, so a subscriber only needs the
+    newest one: publishing overwrites the slot instead of queueing, and a
+    burst of updates reaches a slow reader as a single payload.
+    """
+
+    __slots__ = ("_update", "_ready")
+
+    def __init__(self, update: TimelineUpdate) -> None:
+        self._update = update
+        self._ready = asyncio.Event()
+        self._ready.set()
+
+    def publish(self, update: TimelineUpdate) -> None:
+        self._update = update
+        self._ready.set()
+
+    async def get(self) -> TimelineUpdate:
+        """Wait for an update not yet returned and return the newest one."""
+        await self._ready.wait()
+        self._ready.clear()
+        return self._update
+
+
 @dataclass
 class _SessionEntry:
     session: "PersistentSession"
-    last_access: datetime
-
-
-def _ensure_and_update_last_access(entry: _SessionEntry) -> datetime:
-    """Normalize cached timestamps to UTC to avoid naive/aware comparisons."""
-    normalized = _ensure_utc(entry.last_access)
-    if normalized is not entry.last_access:
-        entry.last_access = normalized
-    return normalized
+    last_access: float  # time.monotonic() seconds
+    hits: int = 0
 
 
 class PersistentSession(SessionABC):
@@ -216,23 +278,40 @@ class PersistentSession(SessionABC):
         items: list[TResponseInputItem],
         timeline: TimelineState,
         intake_store: IntakeStore,
-        planning_context: PlanningContext | None,
-        optimization_result: OptimizationResult | None,
         documents: dict[str, DocumentArtifact] | None,
     ) -> None:
         self.session_id = session_id
+        # Fixed at construction, so ownership checks need no lock.
         self._owner_user_id = owner_user_id
-        self._items = items
+        # Copy-on-write: every change rebinds a new tuple, so readers can take
+        # the current history without copying it under the lock.
+        self._items: tuple[TResponseInputItem, ...] = tuple(items)
         self._timeline = timeline
+        self._timeline_update: TimelineUpdate | None = None
         self._intake = intake_store
-        self._planning_context = planning_context
-        self._optimization_result = optimization_result
+        # The planning and optimization blobs are the largest per session and
+        # many requests never read them, so they are fetched on first access.
+        self._planning_context: PlanningContext | None = None
+        self._optimization_result: OptimizationResult | None = None
+        self._planning_loaded = False
+        self._optimization_loaded = False
         self._documents = documents or {}
         self._temp_path_index: dict[str, str] = {}
         self._document_temp_paths: dict[str, str] = {}
-        self._timeline_watchers: set[asyncio.Queue[TimelineUpdatePayload]] = set()
-        self._ephemeral_items: dict[str, TResponseInputItem] = {}
-        self._lock = threading.RLock()
+        # Copy-on-write: replaced wholesale under ``_watcher_lock`` so that
+        # broadcasts can iterate the current tuple without any lock.
+        self._timeline_watchers: tuple[TimelineWatcher, ...] = ()
+        self._watcher_lock = threading.Lock()
+        # Ephemeral id -> (index in ``_items`` at push time, item).
+        self._ephemeral_items: dict[str, tuple[int, TResponseInputItem]] = {}
+        self._write_queue: asyncio.Queue[_PendingWrite] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        self._last_write: asyncio.Future[None] | None = None
+        # Not re-entrant: code holding the lock must not call back into
+        # methods that acquire it (timeline mutators included). History,
+        # timeline, planning and optimization are only ever rebound to new
+        # objects, never changed in place, so their readers skip the lock.
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Construction helpers
@@ -254,75 +333,41 @@ class PersistentSession(SessionABC):
                     repo.upsert_session(session_id, user_id)
             else:
                 session_id = _generate_session_id()
-                while repo.get_session(session_id) is not None:
-                    session_id = _generate_session_id()
                 repo.upsert_session(session_id, user_id)
             db.commit()
+            session = cls._load(repo, session_id, user_id)
 
-        session = cls._load(session_id)
         session.ensure_owner(user_id)
         return session_id, session
 
     @classmethod
     def load_existing(cls, session_id: str) -> Optional["PersistentSession"]:
-        with SessionLocal() as db:
-            repo = SessionRepository(db)
-            record = repo.get_session(session_id)
-        if record is None:
-            return None
-        return cls._load(session_id)
-
-    @classmethod
-    def _load(cls, session_id: str) -> "PersistentSession":
         with SessionLocal() as db:
             repo = SessionRepository(db)
             record = repo.get_session(session_id)
             if record is None:
-                raise ValueError(f"Session {session_id} not found in database")
-
-            messages = [msg.content for msg in repo.list_messages(session_id)]
-            timeline_dict = repo.get_timeline(session_id) or {}
-            intake_store = _intake_store_from_records(
-                repo.list_intake_revisions(session_id)
-            )
-            planning_dict = repo.get_planning_context(session_id)
-            optimization_model = repo.get_optimization_result(session_id)
-            document_rows = repo.list_document_artifacts(session_id)
-
-        planning_context = (
-            PlanningContext.model_validate(planning_dict)
-            if planning_dict is not None
-            else None
-        )
+                return None
+            return cls._load(repo, session_id, record.user_id)
 
-        optimization_result = (
-            OptimizationResult.model_validate(optimization_model.result)
-            if optimization_model is not None
-            else None
-        )
-        if optimization_result is not None and optimization_model is not None:
-            optimization_result.engine_recommended_index = (
-                optimization_model.engine_recommended_index
-            )
-            optimization_result.advisor_recommended_index = (
-                optimization_model.advisor_recommended_index
-            )
+    @classmethod
+    def _load(
+        cls, repo: SessionRepository, session_id: str, owner_user_id: str
+    ) -> "PersistentSession":
+        """Hydrate a session whose row the caller has already looked up."""
 
-        timeline_state = _timeline_from_dict(timeline_dict)
-        documents = _documents_from_records(document_rows)
+        bundle = repo.load_bundle(session_id)
+        intake_store = _intake_store_from_records(bundle.intake_revisions)
+        timeline_state = _timeline_from_dict(bundle.timeline or {})
+        documents = _documents_from_records(bundle.document_artifacts)
 
-        message_items: list[TResponseInputItem] = [
-            cast(TResponseInputItem, message) for message in messages
-        ]
+        message_items = cast(list[TResponseInputItem], bundle.messages)
 
         return cls(
             session_id=session_id,
-            owner_user_id=record.user_id,
+            owner_user_id=owner_user_id,
             items=message_items,
             timeline=timeline_state,
             intake_store=intake_store,
-            planning_context=planning_context,
-            optimization_result=optimization_result,
             documents=documents,
         )
 
@@ -332,98 +377,197 @@ class PersistentSession(SessionABC):
 
     @property
     def owner_user_id(self) -> str:
-        with self._lock:
-            return self._owner_user_id
+        return self._owner_user_id
 
     def ensure_owner(self, user_id: str) -> None:
-        with self._lock:
-            if self._owner_user_id != user_id:
-                raise PermissionError("Session ownership mismatch")
+        if self._owner_user_id != user_id:
+            raise PermissionError("Session ownership mismatch")
 
     # ------------------------------------------------------------------
     # Conversation history
     # ------------------------------------------------------------------
 
     async def get_items(self, limit: Optional[int] = None) -> list[TResponseInputItem]:
-        with self._lock:
-            if limit is None:
-                snapshot: list[TResponseInputItem] = list(self._items)
-            else:
-                snapshot = self._items[-limit:]
-        return cast(list[TResponseInputItem], copy.deepcopy(snapshot))
+        snapshot = self._items
+        if limit is not None:
+            snapshot = snapshot[-limit:]
+        return [cast(TResponseInputItem, _clone_item(item)) for item in snapshot]
 
     async def add_items(self, items: list[TResponseInputItem]) -> None:
         if not items:
             return
-        payload = cast(list[TResponseInputItem], copy.deepcopy(items))
+        payload = [cast(TResponseInputItem, _clone_item(item)) for item in items]
         with self._lock:
-            self._items.extend(payload)
-        await asyncio.get_running_loop().run_in_executor(
-            None, self._append_messages, payload
-        )
+            self._items += tuple(payload)
+        # The in-memory history is already updated, so the turn does not need
+        # to wait for the database; ``flush`` waits when that matters.
+        done = await self._submit_write(partial(self._append_messages, items=payload))
+        _background_writes.add(done)
+        done.add_done_callback(self._on_background_write_done)
 
     async def pop_item(self) -> TResponseInputItem | None:
         with self._lock:
-            item = self._items.pop() if self._items else None
+            items = self._items
+            item = items[-1] if items else None
+            self._items = items[:-1]
         if item is not None:
-            await asyncio.get_running_loop().run_in_executor(
-                None, self._pop_last_message
-            )
-        return cast(TResponseInputItem | None, copy.deepcopy(item))
+            await self._enqueue_write(self._pop_last_message)
+        # The popped item is no longer reachable from the history, so hand it
+        # over as-is instead of copying it.
+        return item
 
     async def clear_session(self) -> None:
         with self._lock:
-            self._items.clear()
-            self._timeline.clear()
+            self._items = ()
+            self._timeline = TimelineState()
             self._intake.clear()
             self._planning_context = None
             self._optimization_result = None
+            self._planning_loaded = self._optimization_loaded = True
             self._documents.clear()
             self._temp_path_index.clear()
             self._document_temp_paths.clear()
             self._ephemeral_items.clear()
-            watchers = list(self._timeline_watchers)
-            payload = self._timeline.to_dict()
-        await asyncio.get_running_loop().run_in_executor(None, self._clear_persistence)
-        self._broadcast_timeline(payload, watchers)
+            update = self._timeline_update = _timeline_update(self._timeline)
+        await self._enqueue_write(self._clear_persistence)
+        self._broadcast_timeline(update)
+
+    # ------------------------------------------------------------------
+    # Write coalescing
+    # ------------------------------------------------------------------
+
+    async def _enqueue_write(self, write: _RepoWrite, key: str | None = None) -> None:
+        """Queue a history write and wait until its batch has been committed."""
+        await (await self._submit_write(write, key))
+
+    async def _submit_write(
+        self, write: _RepoWrite, key: str | None = None
+    ) -> asyncio.Future[None]:
+        """Queue a history write and return a future for its commit.
+
+        Writes issued while a batch is in flight are drained together and
+        committed in a single transaction, in the order they were queued.
+        A write with a ``key`` replaces the whole stored value, so only the
+        last write per key in a batch is applied.
+        Waits for room when ``_MAX_PENDING_WRITES`` writes are already queued.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._writer_task
+        if (
+            self._write_queue is None
+            or task is None
+            or task.done()
+            or task.get_loop() is not loop
+        ):
+            self._write_queue = asyncio.Queue(maxsize=_MAX_PENDING_WRITES)
+        queue = self._write_queue
+        done: asyncio.Future[None] = loop.create_future()
+        await queue.put((write, done, key))
+        task = self._writer_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._writer_task = loop.create_task(self._drain_writes(queue))
+        self._last_write = done
+        return done
+
+    async def flush(self) -> None:
+        """Wait until every write queued so far on this loop has been committed."""
+        last = self._last_write
+        if last is not None and last.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait((last,))
+
+    def _on_background_write_done(self, done: asyncio.Future[None]) -> None:
+        _background_writes.discard(done)
+        if not done.cancelled() and done.exception() is not None:
+            logger.error(
+                "Failed to persist history for session %s",
+                self.session_id,
+                exc_info=done.exception(),
+            )
+
+    async def _drain_writes(self, queue: asyncio.Queue[_PendingWrite]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: list[_PendingWrite] = []
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if not batch:
+                return
+            futures = [done for _, done, _ in batch]
+            try:
+                await loop.run_in_executor(
+                    None, self._apply_writes, _coalesce_writes(batch)
+                )
+            except asyncio.CancelledError:
+                for done in futures:
+                    done.cancel()
+                raise
+            except Exception as exc:
+                for done in futures:
+                    if not done.done():
+                        done.set_exception(exc)
+            else:
+                for done in futures:
+                    if not done.done():
+                        done.set_result(None)
+
+    def _apply_writes(self, writes: list[_RepoWrite]) -> None:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            for write in writes:
+                write(repo)
+            db.commit()
 
     # ------------------------------------------------------------------
     # Timeline helpers
     # ------------------------------------------------------------------
 
+    # Timeline events are frozen and states only ever rebind their fields, so a
+    # shallow copy is enough to detach a snapshot from later updates. Updates
+    # publish a new state object, so readers can load it without the lock.
+
     def get_timeline(self) -> TimelineState:
-        with self._lock:
-            return copy.deepcopy(self._timeline)
+        return copy.copy(self._timeline)
+
+    def get_timeline_payload(self) -> TimelineUpdatePayload:
+        """Return the timeline in its frontend shape, as sent to watchers.
+
+        The dict is cached per timeline version and shared, so treat it as
+        read-only.
+        """
+        return self._current_timeline_update()[0]
 
     async def apply_timeline_update(
         self, mutator: Callable[[TimelineState], None]
     ) -> TimelineState:
         with self._lock:
-            updated = copy.deepcopy(self._timeline)
+            updated = copy.copy(self._timeline)
             mutator(updated)
             self._timeline = updated
-            watchers = list(self._timeline_watchers)
-            payload = updated.to_dict()
-        await asyncio.get_running_loop().run_in_executor(
-            None, self._persist_timeline, payload
+            update = self._timeline_update = _timeline_update(updated)
+        await self._enqueue_write(
+            partial(self._persist_timeline, state_json=update[1]), _TIMELINE_WRITE_KEY
         )
-        self._broadcast_timeline(payload, watchers)
-        return copy.deepcopy(updated)
+        self._broadcast_timeline(update)
+        return copy.copy(updated)
 
     # ------------------------------------------------------------------
     # Intake helpers
     # ------------------------------------------------------------------
 
+    # Stored intake records are never modified after ``IntakeStore.submit``
+    # copies them in, so readers share them instead of deep-copying.
+
     def get_intake(self) -> IntakeStore:
         with self._lock:
-            return copy.deepcopy(self._intake)
+            return self._intake.copy()
 
     def get_intake_record(self) -> Optional[InterviewRecord]:
         with self._lock:
             current = self._intake.current()
-            if current is None:
-                return None
-            return current.record.model_copy(deep=True)
+            return None if current is None else current.record
 
     def save_intake_submission(self, submission: IntakeSubmission) -> IntakeRevision:
         with self._lock:
@@ -435,11 +579,18 @@ class PersistentSession(SessionABC):
     # Planning / Optimization helpers
     # ------------------------------------------------------------------
 
+    # Setters store a private copy of the frozen model and every change goes
+    # through them, so the stored instance is handed out as-is. Callers must
+    # treat it, including its lists and dicts, as read-only.
+
     def set_planning_context(self, context: PlanningContext) -> PlanningContext:
+        encoded = context.model_dump_json()
+        stored = PlanningContext.model_validate_json(encoded)
         with self._lock:
-            self._planning_context = context.model_copy(deep=True)
-        self._persist_planning_context(self._planning_context)
-        return self._planning_context.model_copy(deep=True)
+            self._planning_context = stored
+            self._planning_loaded = True
+        self._persist_planning_context(encoded)
+        return stored
 
     async def set_planning_context_async(
         self, context: PlanningContext
@@ -448,18 +599,17 @@ class PersistentSession(SessionABC):
         return await loop.run_in_executor(None, self.set_planning_context, context)
 
     def get_planning_context(self) -> PlanningContext | None:
-        with self._lock:
-            return (
-                self._planning_context.model_copy(deep=True)
-                if self._planning_context
-                else None
-            )
+        self._ensure_planning_context_loaded()
+        return self._planning_context
 
     def set_optimization_result(self, result: OptimizationResult) -> OptimizationResult:
+        encoded = result.model_dump_json()
+        stored = OptimizationResult.model_validate_json(encoded)
         with self._lock:
-            self._optimization_result = result.model_copy(deep=True)
-        self._persist_optimization_result(self._optimization_result)
-        return self._optimization_result.model_copy(deep=True)
+            self._optimization_result = stored
+            self._optimization_loaded = True
+        self._persist_optimization_result(stored, encoded)
+        return stored
 
     async def set_optimization_result_async(
         self, result: OptimizationResult
@@ -468,22 +618,50 @@ class PersistentSession(SessionABC):
         return await loop.run_in_executor(None, self.set_optimization_result, result)
 
     def get_optimization_result(self) -> OptimizationResult | None:
+        self._ensure_optimization_result_loaded()
+        return self._optimization_result
+
+    def _ensure_planning_context_loaded(self) -> None:
+        if self._planning_loaded:
+            return
+        # Query outside the lock; a setter that lands meanwhile wins.
+        with SessionLocal() as db:
+            data = SessionRepository(db).get_planning_context(self.session_id)
+        context = PlanningContext.model_validate(data) if data is not None else None
         with self._lock:
-            return (
-                self._optimization_result.model_copy(deep=True)
-                if self._optimization_result
-                else None
-            )
+            if not self._planning_loaded:
+                self._planning_context = context
+                self._planning_loaded = True
+
+    def _ensure_optimization_result_loaded(self) -> None:
+        if self._optimization_loaded:
+            return
+        with SessionLocal() as db:
+            record = SessionRepository(db).get_optimization_result(self.session_id)
+            result = None
+            if record is not None:
+                result = OptimizationResult.model_validate(
+                    {
+                        **record.result,
+                        "engine_recommended_index": record.engine_recommended_index,
+                        "advisor_recommended_index": record.advisor_recommended_index,
+                    }
+                )
+        with self._lock:
+            if not self._optimization_loaded:
+                self._optimization_result = result
+                self._optimization_loaded = True
 
     # ------------------------------------------------------------------
     # Document artifact helpers
     # ------------------------------------------------------------------
 
+    # Document models are frozen and updates replace the stored artifact, so
+    # they are handed out without copying.
+
     def list_documents(self) -> list[DocumentArtifact]:
         with self._lock:
-            return [
-                artifact.model_copy(deep=True) for artifact in self._documents.values()
-            ]
+            return list(self._documents.values())
 
     def document_summaries(self) -> list[DocumentArtifactSummary]:
         summaries: list[DocumentArtifactSummary] = []
@@ -500,15 +678,8 @@ class PersistentSession(SessionABC):
                         mime_type=artifact.mime_type,
                         locale=extract.locale if extract else None,
                         warnings=list(extract.warnings) if extract else [],
-                        key_value_pairs=[
-                            item.model_copy(deep=True)
-                            for item in extract.key_value_pairs
-                        ]
-                        if extract
-                        else [],
-                        tables=[table.model_copy(deep=True) for table in extract.tables]
-                        if extract
-                        else [],
+                        key_value_pairs=extract.key_value_pairs if extract else [],
+                        tables=extract.tables if extract else [],
                         text_preview=extract.text_preview if extract else None,
                         text_truncated=extract.text_truncated if extract else False,
                     )
@@ -517,8 +688,7 @@ class PersistentSession(SessionABC):
 
     def get_document(self, document_id: str) -> DocumentArtifact | None:
         with self._lock:
-            artifact = self._documents.get(document_id)
-            return artifact.model_copy(deep=True) if artifact else None
+            return self._documents.get(document_id)
 
     def register_document_stub(
         self,
@@ -546,15 +716,14 @@ class PersistentSession(SessionABC):
             self._temp_path_index[temp_path] = document_id
             self._document_temp_paths[document_id] = temp_path
         self._persist_document_artifact(artifact)
-        return artifact.model_copy(deep=True)
+        return artifact
 
     def resolve_document_for_temp_path(self, temp_path: str) -> DocumentArtifact | None:
         with self._lock:
             document_id = self._temp_path_index.get(temp_path)
             if not document_id:
                 return None
-            artifact = self._documents.get(document_id)
-            return artifact.model_copy(deep=True) if artifact else None
+            return self._documents.get(document_id)
 
     def set_document_extract(
         self,
@@ -567,15 +736,13 @@ class PersistentSession(SessionABC):
             artifact = self._documents.get(document_id)
             if artifact is None:
                 return None
-            artifact.extract = extract
-            artifact.extracted_at = _utcnow()
+            changes: dict[str, Any] = {"extract": extract, "extracted_at": _utcnow()}
             if document_type:
-                artifact.document_type = document_type
-            updated = artifact.model_copy(deep=True)
-        self._persist_document_artifact(updated)
-        with self._lock:
+                changes["document_type"] = document_type
+            updated = artifact.model_copy(update=changes)
             self._documents[document_id] = updated
-        return updated.model_copy(deep=True)
+        self._persist_document_artifact(updated)
+        return updated
 
     def get_document_temp_path(self, document_id: str) -> str | None:
         with self._lock:
@@ -595,80 +762,79 @@ class PersistentSession(SessionABC):
         }
         item_typed = cast(TResponseInputItem, item)
         with self._lock:
-            self._items.append(item_typed)
-            self._ephemeral_items[ephemeral_id] = item_typed
+            self._ephemeral_items[ephemeral_id] = (len(self._items), item_typed)
+            self._items += (item_typed,)
         return ephemeral_id
 
     def pop_ephemeral_message(self, ephemeral_id: str) -> None:
         if not ephemeral_id:
             return
         with self._lock:
-            item = self._ephemeral_items.pop(ephemeral_id, None)
-            if item is None:
+            entry = self._ephemeral_items.pop(ephemeral_id, None)
+            if entry is None:
                 return
-            try:
-                self._items.remove(item)
-            except ValueError:
-                pass
+            index, item = entry
+            items = self._items
+            # Later turns only append, so the item is normally still at its
+            # recorded index; earlier pops can only have moved it left.
+            for position in range(min(index, len(items) - 1), -1, -1):
+                if items[position] is item:
+                    self._items = items[:position] + items[position + 1 :]
+                    return
 
     # ------------------------------------------------------------------
     # Timeline watchers
     # ------------------------------------------------------------------
 
-    def register_timeline_watcher(self) -> asyncio.Queue[TimelineUpdatePayload]:
-        queue: asyncio.Queue[TimelineUpdatePayload] = asyncio.Queue()
+    def register_timeline_watcher(self) -> TimelineWatcher:
+        """Subscribe to timeline changes, starting with the current snapshot.
+
+        Each update is a ``(payload, encoded_json)`` pair; the JSON is encoded
+        once per change and shared by all watchers.
+        """
+        watcher = TimelineWatcher(self._current_timeline_update())
+        with self._watcher_lock:
+            self._timeline_watchers += (watcher,)
+        return watcher
+
+    def _current_timeline_update(self) -> TimelineUpdate:
+        update = self._timeline_update
+        if update is not None:
+            return update
         with self._lock:
-            self._timeline_watchers.add(queue)
-            payload = self._timeline.to_dict()
-        queue.put_nowait(payload)
-        return queue
+            update = self._timeline_update
+            if update is None:
+                update = self._timeline_update = _timeline_update(self._timeline)
+        return update
+
+    def unregister_timeline_watcher(self, watcher: TimelineWatcher) -> None:
+        with self._watcher_lock:
+            self._timeline_watchers = tuple(
+                current for current in self._timeline_watchers if current is not watcher
+            )
 
-    def unregister_timeline_watcher(
-        self, queue: asyncio.Queue[TimelineUpdatePayload]
-    ) -> None:
-        with self._lock:
-            self._timeline_watchers.discard(queue)
-
-    def _broadcast_timeline(
-        self,
-        payload: TimelineUpdatePayload,
-        watchers: Optional[list[asyncio.Queue[TimelineUpdatePayload]]] = None,
-    ) -> None:
-        targets = watchers if watchers is not None else list(self._timeline_watchers)
-        for queue in targets:
-            try:
-                queue.put_nowait(payload)
-            except asyncio.QueueFull:
-                logger.warning(
-                    "Timeline watcher queue full for session %s", self.session_id
-                )
+    def _broadcast_timeline(self, update: TimelineUpdate) -> None:
+        for watcher in self._timeline_watchers:
+            watcher.publish(update)
 
     # ------------------------------------------------------------------
     # Persistence helpers (run in executor or synchronously)
     # ------------------------------------------------------------------
 
-    def _append_messages(self, items: list[TResponseInputItem]) -> None:
+    def _append_messages(
+        self, repo: SessionRepository, items: list[TResponseInputItem]
+    ) -> None:
         dict_items: list[dict[str, Any]] = [
             cast(dict[str, Any], item) for item in items if isinstance(item, dict)
         ]
-        if not dict_items:
-            return
-        with SessionLocal() as db:
-            repo = SessionRepository(db)
+        if dict_items:
             repo.append_messages(self.session_id, dict_items)
-            db.commit()
 
-    def _pop_last_message(self) -> None:
-        with SessionLocal() as db:
-            repo = SessionRepository(db)
-            repo.pop_last_message(self.session_id)
-            db.commit()
+    def _pop_last_message(self, repo: SessionRepository) -> None:
+        repo.pop_last_message(self.session_id)
 
-    def _persist_timeline(self, state: dict[str, Any]) -> None:
-        with SessionLocal() as db:
-            repo = SessionRepository(db)
-            repo.upsert_timeline(self.session_id, state)
-            db.commit()
+    def _persist_timeline(self, repo: SessionRepository, state_json: str) -> None:
+        repo.upsert_timeline(self.session_id, state_json)
 
     def _persist_intake_revision(self, revision: dict[str, Any]) -> None:
         with SessionLocal() as db:
@@ -676,27 +842,26 @@ class PersistentSession(SessionABC):
             repo.add_intake_revision(self.session_id, revision)
             db.commit()
 
-    def _persist_planning_context(self, context: PlanningContext | None) -> None:
+    # The stored JSON is what pydantic-core already produced for the memo, so
+    # persisting it skips model_dump() and a second, stdlib json encode.
+
+    def _persist_planning_context(self, context_json: str) -> None:
         with SessionLocal() as db:
             repo = SessionRepository(db)
-            if context is None:
-                repo.delete_planning_context(self.session_id)
-            else:
-                repo.save_planning_context(self.session_id, context.model_dump())
+            repo.save_planning_context(self.session_id, context_json)
             db.commit()
 
-    def _persist_optimization_result(self, result: OptimizationResult | None) -> None:
+    def _persist_optimization_result(
+        self, result: OptimizationResult, result_json: str
+    ) -> None:
         with SessionLocal() as db:
             repo = SessionRepository(db)
-            if result is None:
-                repo.delete_optimization_result(self.session_id)
-            else:
-                repo.save_optimization_result(
-                    self.session_id,
-                    result.model_dump(),
-                    result.engine_recommended_index,
-                    result.advisor_recommended_index,
-                )
+            repo.save_optimization_result(
+                self.session_id,
+                result_json,
+                result.engine_recommended_index,
+                result.advisor_recommended_index,
+            )
             db.commit()
 
     def _persist_document_artifact(self, artifact: DocumentArtifact | None) -> None:
@@ -721,51 +886,92 @@ class PersistentSession(SessionABC):
                 )
             db.commit()
 
-    def _clear_persistence(self) -> None:
-        with SessionLocal() as db:
-            repo = SessionRepository(db)
-            repo.clear_messages(self.session_id)
-            repo.delete_timeline(self.session_id)
-            repo.clear_intake(self.session_id)
-            repo.delete_planning_context(self.session_id)
-            repo.delete_optimization_result(self.session_id)
-            repo.clear_document_artifacts(self.session_id)
-            db.commit()
+    def _clear_persistence(self, repo: SessionRepository) -> None:
+        repo.clear_messages(self.session_id)
+        repo.delete_timeline(self.session_id)
+        repo.clear_intake(self.session_id)
+        repo.delete_planning_context(self.session_id)
+        repo.delete_optimization_result(self.session_id)
+        repo.clear_document_artifacts(self.session_id)
 
 
 # ----------------------------------------------------------------------
 # Global session cache helpers
 # ----------------------------------------------------------------------
 
-_session_cache: Dict[str, _SessionEntry] = {}
+# Ordered from least to most recently used: every hit moves its entry to the
+# end, so expiry and capacity eviction only ever look at the front.
+_session_cache: "OrderedDict[str, _SessionEntry]" = OrderedDict()
+
+# Full expiry sweeps run at most this often; lookups still reject a stale hit.
+_PURGE_INTERVAL_SECONDS = 1.0
+_last_purge_monotonic = 0.0
 
 
-def _purge_expired_sessions(now: datetime) -> None:
-    now = _ensure_utc(now)
+def _purge_expired_sessions(now: float) -> None:
     ttl_minutes = settings.session_ttl_minutes
-    max_entries = settings.session_max_entries
 
     if ttl_minutes > 0:
-        expiry_threshold = now - timedelta(minutes=ttl_minutes)
-        expired_keys = [
-            key
-            for key, entry in _session_cache.items()
-            if _ensure_and_update_last_access(entry) < expiry_threshold
-        ]
-        for key in expired_keys:
+        expiry_threshold = now - ttl_minutes * 60
+        while _session_cache:
+            key, entry = next(iter(_session_cache.items()))
+            if entry.last_access >= expiry_threshold:
+                break
             logger.debug("Evicting expired session: %s", key)
-            del _session_cache[key]
+            _session_cache.popitem(last=False)
+
+    _evict_over_capacity(now)
+
+
+# Capacity eviction picks the lowest-value entry among this share of the
+# least recently used ones, so a busy session is not dropped just because it
+# paused briefly while many idle ones were touched once.
+_EVICTION_WINDOW_FRACTION = 0.1
 
-    if max_entries > 0 and len(_session_cache) > max_entries:
-        surplus = len(_session_cache) - max_entries
-        if surplus > 0:
-            ordered = sorted(
-                _session_cache.items(),
-                key=lambda item: _ensure_and_update_last_access(item[1]),
+
+def _eviction_score(entry: _SessionEntry, now: float) -> float:
+    return math.log1p(entry.hits) / max(1.0, now - entry.last_access)
+
+
+def _evict_over_capacity(now: float) -> None:
+    max_entries = settings.session_max_entries
+    if max_entries > 0:
+        while len(_session_cache) > max_entries:
+            window = max(1, int(len(_session_cache) * _EVICTION_WINDOW_FRACTION))
+            key = min(
+                islice(_session_cache, window),
+                key=lambda k: _eviction_score(_session_cache[k], now),
             )
-            for key, _ in ordered[:surplus]:
-                logger.debug("Evicting LRU session to maintain capacity: %s", key)
-                del _session_cache[key]
+            del _session_cache[key]
+            logger.debug("Evicting session to maintain capacity: %s", key)
+
+
+def _maybe_purge_expired_sessions(now: float) -> None:
+    global _last_purge_monotonic
+    if now - _last_purge_monotonic >= _PURGE_INTERVAL_SECONDS:
+        _purge_expired_sessions(now)
+        _last_purge_monotonic = now
+
+
+def _lookup_cached(session_id: str, now: float) -> _SessionEntry | None:
+    entry = _session_cache.get(session_id)
+    if entry is None:
+        return None
+    ttl_minutes = settings.session_ttl_minutes
+    if ttl_minutes > 0 and now - entry.last_access > ttl_minutes * 60:
+        logger.debug("Evicting expired session: %s", session_id)
+        del _session_cache[session_id]
+        return None
+    entry.last_access = now
+    entry.hits += 1
+    _session_cache.move_to_end(session_id)
+    return entry
+
+
+def _cache_session(session_id: str, entry: _SessionEntry) -> None:
+    _session_cache[session_id] = entry
+    _session_cache.move_to_end(session_id)
+    _evict_over_capacity(entry.last_access)
 
 
 def get_or_create_session(
@@ -774,20 +980,19 @@ def get_or_create_session(
     if not user_id:
         raise ValueError("user_id is required to create or load a session")
     with _cache_lock:
-        now = _utcnow()
-        _purge_expired_sessions(now)
+        now = time.monotonic()
+        _maybe_purge_expired_sessions(now)
 
         if session_id:
-            entry = _session_cache.get(session_id)
+            entry = _lookup_cached(session_id, now)
             if entry is not None:
                 entry.session.ensure_owner(user_id)
-                entry.last_access = now
                 return session_id, entry.session
 
     new_id, session = PersistentSession.load_or_create(session_id, user_id)
     with _cache_lock:
-        _session_cache[new_id] = _SessionEntry(session=session, last_access=_utcnow())
-        _purge_expired_sessions(_utcnow())
+        now = time.monotonic()
+        _cache_session(new_id, _SessionEntry(session=session, last_access=now))
     return new_id, session
 
 
@@ -795,15 +1000,14 @@ def get_session(
     session_id: str,
     user_id: str | None = None,
 ) -> PersistentSession | None:
-    now = _utcnow()
+    now = time.monotonic()
 
     with _cache_lock:
-        _purge_expired_sessions(now)
-        entry = _session_cache.get(session_id)
+        _maybe_purge_expired_sessions(now)
+        entry = _lookup_cached(session_id, now)
         if entry is not None:
             if user_id:
                 entry.session.ensure_owner(user_id)
-            entry.last_access = now
             return entry.session
 
     session = PersistentSession.load_existing(session_id)
@@ -813,11 +1017,21 @@ def get_session(
         session.ensure_owner(user_id)
 
     with _cache_lock:
-        _session_cache[session_id] = _SessionEntry(session=session, last_access=now)
-        _purge_expired_sessions(now)
+        _cache_session(session_id, _SessionEntry(session=session, last_access=now))
     return session
 
 
+async def flush_pending_writes() -> None:
+    """Wait for background history writes issued on the running loop.
+
+    Called on application shutdown so queued messages are not lost.
+    """
+    loop = asyncio.get_running_loop()
+    pending = [done for done in _background_writes if done.get_loop() is loop]
+    if pending:
+        await asyncio.wait(pending)
+
+
 def clear_all_sessions() -> None:
     with _cache_lock:
         _session_cache.clear()
@@ -827,5 +1041,7 @@ __all__ = [
     "get_or_create_session",
     "get_session",
     "clear_all_sessions",
+    "flush_pending_writes",
     "PersistentSession",
+    "TimelineWatcher",
 ]
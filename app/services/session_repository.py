@@ -6,7 +6,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Iterable, Optional
 
-from sqlalchemy import delete, func, select, text, update
+from sqlalchemy import String, cast, delete, func, literal, select, text, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session
 
@@ -24,12 +25,36 @@ class SessionTranscriptMessage:
     created_at: datetime
 
 
+@dataclass(frozen=True)
+class SessionBundle:
+    """Eagerly loaded session state, fetched in a single round-trip."""
+
+    messages: list[dict[str, Any]]
+    timeline: Optional[dict[str, Any]]
+    intake_revisions: list[dict[str, Any]]
+    document_artifacts: list[dict[str, Any]]
+
+
+def _jsonb(encoded: str) -> Any:
+    """Bind already-encoded JSON text so Postgres parses it as JSONB."""
+    return cast(literal(encoded, String), JSONB)
+
+
 class SessionRepository:
     """CRUD helpers around the persistent session schema."""
 
     def __init__(self, db: Session) -> None:
         self._db = db
 
+    def _upsert_session_row(self, model: Any, **values: Any) -> None:
+        """Insert or overwrite a one-row-per-session table in one statement."""
+        stmt = insert(model).values(**values)
+        updates = {key: stmt.excluded[key] for key in values if key != "session_id"}
+        updates["updated_at"] = func.now()
+        self._db.execute(
+            stmt.on_conflict_do_update(index_elements=["session_id"], set_=updates)
+        )
+
     def upsert_session(self, session_id: str, user_id: str) -> models.UserSession:
         record = self._db.get(models.UserSession, session_id)
         if record:
@@ -82,6 +107,41 @@ class SessionRepository:
         result = self._db.execute(stmt)
         return list(result.scalars())
 
+    def load_bundle(self, session_id: str) -> SessionBundle:
+        """Fetch messages, timeline, intake revisions and documents at once.
+
+        Each collection is aggregated to JSON server-side with the same
+        ordering as the corresponding ``list_*`` helper.
+        """
+
+        stmt = text(
+            """
+            SELECT
+                (SELECT coalesce(jsonb_agg(m.content ORDER BY m.created_at, m.id),
+                                 '[]'::jsonb)
+                   FROM session_messages m
+                  WHERE m.session_id = :session_id) AS messages,
+                (SELECT t.state
+                   FROM session_timeline_snapshots t
+                  WHERE t.session_id = :session_id) AS timeline,
+                (SELECT coalesce(jsonb_agg(r.revision ORDER BY r.created_at),
+                                 '[]'::jsonb)
+                   FROM session_intake_revisions r
+                  WHERE r.session_id = :session_id) AS intake_revisions,
+                (SELECT coalesce(jsonb_agg(to_jsonb(d) ORDER BY d.uploaded_at),
+                                 '[]'::jsonb)
+                   FROM session_document_artifacts d
+                  WHERE d.session_id = :session_id) AS document_artifacts
+            """
+        )
+        row = self._db.execute(stmt, {"session_id": session_id}).mappings().one()
+        return SessionBundle(
+            messages=row["messages"],
+            timeline=row["timeline"],
+            intake_revisions=row["intake_revisions"],
+            document_artifacts=row["document_artifacts"],
+        )
+
     def list_transcript_messages(
         self, session_id: str
     ) -> list[SessionTranscriptMessage]:
@@ -187,11 +247,12 @@ class SessionRepository:
         )
         self._db.flush()
 
-    def upsert_timeline(self, session_id: str, state: dict[str, Any]) -> None:
-        self._db.merge(
-            models.SessionTimelineSnapshot(session_id=session_id, state=state)
+    def upsert_timeline(self, session_id: str, state_json: str) -> None:
+        self._upsert_session_row(
+            models.SessionTimelineSnapshot,
+            session_id=session_id,
+            state=_jsonb(state_json),
         )
-        self._db.flush()
 
     def get_timeline(self, session_id: str) -> Optional[dict[str, Any]]:
         snapshot = self._db.get(models.SessionTimelineSnapshot, session_id)
@@ -247,11 +308,12 @@ class SessionRepository:
         result = self._db.execute(stmt)
         return list(result.scalars())
 
-    def save_planning_context(self, session_id: str, context: dict[str, Any]) -> None:
-        self._db.merge(
-            models.SessionPlanningContext(session_id=session_id, context=context)
+    def save_planning_context(self, session_id: str, context_json: str) -> None:
+        self._upsert_session_row(
+            models.SessionPlanningContext,
+            session_id=session_id,
+            context=_jsonb(context_json),
         )
-        self._db.flush()
 
     def delete_planning_context(self, session_id: str) -> None:
         self._db.execute(
@@ -268,19 +330,17 @@ class SessionRepository:
     def save_optimization_result(
         self,
         session_id: str,
-        result: dict[str, Any],
+        result_json: str,
         engine_index: Optional[int],
         advisor_index: Optional[int],
     ) -> None:
-        self._db.merge(
-            models.SessionOptimizationResult(
-                session_id=session_id,
-                result=result,
-                engine_recommended_index=engine_index,
-                advisor_recommended_index=advisor_index,
-            )
+        self._upsert_session_row(
+            models.SessionOptimizationResult,
+            session_id=session_id,
+            result=_jsonb(result_json),
+            engine_recommended_index=engine_index,
+            advisor_recommended_index=advisor_index,
         )
-        self._db.flush()
 
     def delete_optimization_result(self, session_id: str) -> None:
         self._db.execute(
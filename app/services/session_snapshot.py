@@ -8,7 +8,7 @@ from typing import Any, Optional, Tuple
 def gather_session_state(
     session,
 ) -> Tuple[dict, dict, Optional[dict], Optional[Any], Optional[dict]]:
-    timeline_state = session.get_timeline().to_dict()
+    timeline_state = session.get_timeline_payload()
     intake_state = session.get_intake().to_dict()
     planning_context = session.get_planning_context()
     planning_state = (
@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 
 from app.config import settings
 from app.routers import chat_router, sessions_router, timeline_router
+from app.services.session_manager import flush_pending_writes
 from app.utils import setup_logging
 from app.agents.orchestrator import create_mortgage_broker_orchestrator
 
@@ -29,6 +30,7 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         logger.info("Shutting down application")
+        await flush_pending_writes()
         app.state.orchestrator = None
 
 
@@ -72,6 +72,12 @@ def test_submit_intake_record_persists_revision(
     assert store.current() is not None
     assert len(store.revisions()) == 1
 
+    # Editing a snapshot must not leak back into the session's store.
+    store.append_note("snapshot-only note")
+    current = session.get_intake().current()
+    assert current is not None
+    assert "snapshot-only note" not in current.confirmation_notes
+
 
 def test_submit_intake_record_requires_existing_session() -> None:
     session_id = "missing-session"
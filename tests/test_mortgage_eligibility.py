@@ -169,3 +169,53 @@ def test_refinance_cannot_worsen_pti():
     )
 
     assert any("מיחזור" in violation for violation in result.violations)
+
+
+def test_adjustments_for_eligible_applicant_keep_current_values():
+    adjustments = MortgageEligibilityEvaluator.adjustments_to_qualify(
+        monthly_net_income=30_000,
+        property_price=1_000_000,
+        down_payment_available=400_000,
+    )
+
+    assert adjustments["reduce_price"] == 1_000_000
+    assert adjustments["required_income"] == 30_000
+    assert adjustments["required_down_payment"] == pytest.approx(250_000)
+
+
+def test_evaluate_fast_matches_full_evaluation():
+    kwargs = dict(
+        monthly_net_income=12_000,
+        property_price=2_000_000,
+        down_payment_available=400_000,
+        property_type=PropertyType.SINGLE,
+        deal_type=DealType.FIRST_HOME,
+        existing_loans_payment=1_000,
+    )
+
+    full = MortgageEligibilityEvaluator.evaluate(**kwargs)
+    is_eligible, pti, ltv, max_loan = MortgageEligibilityEvaluator.evaluate_fast(
+        **kwargs
+    )
+
+    assert is_eligible == full.is_eligible
+    assert pti == pytest.approx(full.debt_to_income_ratio)
+    assert ltv == pytest.approx(full.loan_to_value_ratio)
+    assert max_loan == pytest.approx(full.max_loan_amount)
+
+
+def test_adjustments_reduce_price_to_highest_qualifying_price():
+    kwargs = dict(
+        monthly_net_income=12_000,
+        property_price=2_000_000,
+        down_payment_available=400_000,
+    )
+
+    adjustments = MortgageEligibilityEvaluator.adjustments_to_qualify(**kwargs)
+    target = adjustments["reduce_price"]
+
+    assert target < kwargs["property_price"]
+    at_target = {**kwargs, "property_price": target}
+    above_target = {**kwargs, "property_price": target + 1}
+    assert MortgageEligibilityEvaluator.evaluate(**at_target).is_eligible
+    assert not MortgageEligibilityEvaluator.evaluate(**above_target).is_eligible
@@ -6,7 +6,10 @@ from app.services.mix_optimizer import optimize_mixes
 from app.services.optimization_formatter import (
     format_candidates,
     format_comparison_matrix,
+    format_result,
     format_term_sweep,
+    iter_format_candidates,
+    iter_format_comparison_matrix,
 )
 from app.services.planning_mapper import build_planning_context
 from tests.factories import build_submission
@@ -96,3 +99,44 @@ def test_format_term_sweep() -> None:
     assert "term_years" in entry
     assert "monthly_payment_display" in entry
     assert "pti_ratio_display" in entry
+
+
+def test_format_result_matches_individual_formatters() -> None:
+    submission = build_submission()
+    planning = build_planning_context(submission)
+    result = optimize_mixes(submission.record, planning)
+
+    formatted = format_result(result)
+
+    assert formatted["candidates"] == format_candidates(result)
+    assert formatted["comparison"] == format_comparison_matrix(result)
+
+
+def test_format_result_without_display_keeps_numeric_fields() -> None:
+    submission = build_submission()
+    planning = build_planning_context(submission)
+    result = optimize_mixes(submission.record, planning)
+
+    full = format_result(result)
+    lean = format_result(result, include_display=False)
+
+    def numeric(row):
+        return {k: v for k, v in row.items() if not k.endswith("_display")}
+
+    for full_row, lean_row in zip(full["comparison"], lean["comparison"]):
+        assert lean_row == numeric(full_row)
+    for full_item, lean_item in zip(full["candidates"], lean["candidates"]):
+        assert lean_item["metrics"] == numeric(full_item["metrics"])
+
+
+def test_iter_formatters_yield_same_rows_as_list_formatters() -> None:
+    submission = build_submission()
+    planning = build_planning_context(submission)
+    result = optimize_mixes(submission.record, planning)
+
+    candidates = iter_format_candidates(result)
+    rows = iter_format_comparison_matrix(result)
+
+    assert not isinstance(candidates, list)
+    assert list(candidates) == format_candidates(result)
+    assert list(rows) == format_comparison_matrix(result)
@@ -91,3 +91,14 @@ def test_cpi_soft_cap_removed_for_high_tolerance():
 
     assert context.soft_caps.cpi_share_max is None
     assert context.metadata["assumptions"]["soft_caps"]["cpi_share_max"] is None
+
+
+def test_build_planning_context_can_skip_timestamp():
+    submission = build_submission()
+
+    stamped = build_planning_context(submission)
+    unstamped = build_planning_context(submission, stamp_time=False)
+
+    assert "generated_at" in stamped.metadata
+    assert "generated_at" not in unstamped.metadata
+    assert unstamped.metadata["assumptions"] == stamped.metadata["assumptions"]
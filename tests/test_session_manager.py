@@ -1,14 +1,27 @@
-from datetime import datetime, timedelta
-from typing import Any, TYPE_CHECKING, cast
+import asyncio
+import json
+import time
+from typing import Any, Callable, TYPE_CHECKING, cast
 
 import pytest
+from pydantic import ValidationError
 
 from app.config import settings
 from app.db.session import SessionLocal
 from app.services import session_manager
+from app.services.mix_optimizer import optimize_mixes
+from app.services.planning_mapper import build_planning_context
 from app.services.session_repository import SessionRepository
 from tests.async_utils import run_async
+from tests.factories import build_submission
 from app.models.documents import DocumentExtract, DocumentKeyValue
+from app.models.timeline import (
+    TimelineEvent,
+    TimelineEventStatus,
+    TimelineEventType,
+    TimelineStage,
+    TimelineState,
+)
 
 if TYPE_CHECKING:
     from agents.items import TResponseInputItem
@@ -16,6 +29,16 @@ else:  # pragma: no cover - satisfies runtime when package missing
     TResponseInputItem = Any  # type: ignore[assignment]
 
 
+def _add_items_and_flush(
+    session: session_manager.PersistentSession, items: list["TResponseInputItem"]
+) -> None:
+    async def _run() -> None:
+        await session.add_items(items)
+        await session.flush()
+
+    run_async(_run())
+
+
 @pytest.fixture(autouse=True)
 def _reset_sessions():
     original_max = settings.session_max_entries
@@ -37,9 +60,9 @@ def test_sessions_expire_after_ttl():
     assert cached_entry is not None
 
     # Force the entry to look stale and trigger purge on next access.
-    session_manager._session_cache[session_id].last_access = datetime.now() - timedelta(
-        minutes=2
-    )
+    session_manager._session_cache[session_id].last_access = time.monotonic() - 120
+    # Let the next call run a full sweep instead of waiting out the rate limit.
+    session_manager._last_purge_monotonic = 0.0
 
     session_manager.get_or_create_session(None, user_id="test-user-ttl-2")
     assert session_id not in session_manager._session_cache
@@ -63,6 +86,34 @@ def test_session_cache_respects_capacity():
     assert ids[0] not in session_manager._session_cache
 
 
+def test_session_cache_evicts_least_recently_used():
+    settings.session_max_entries = 2
+    first_id, _ = session_manager.get_or_create_session(None, user_id="lru-user-0")
+    second_id, _ = session_manager.get_or_create_session(None, user_id="lru-user-1")
+
+    # Touch the oldest entry so the second one becomes least recently used.
+    assert session_manager.get_session(first_id) is not None
+    third_id, _ = session_manager.get_or_create_session(None, user_id="lru-user-2")
+
+    assert list(session_manager._session_cache) == [first_id, third_id]
+    assert second_id not in session_manager._session_cache
+
+
+def test_session_cache_keeps_frequently_used_entry_over_idle_one():
+    settings.session_max_entries = 19
+    hot_id, _ = session_manager.get_or_create_session(None, user_id="hot-user")
+    for _ in range(3):
+        assert session_manager.get_session(hot_id) is not None
+    cold_id, _ = session_manager.get_or_create_session(None, user_id="cold-user")
+    for idx in range(18):
+        session_manager.get_or_create_session(None, user_id=f"filler-user-{idx}")
+
+    # Both sit in the least recently used window; the idle one goes first.
+    assert hot_id in session_manager._session_cache
+    assert cold_id not in session_manager._session_cache
+    assert len(session_manager._session_cache) == settings.session_max_entries
+
+
 def test_get_session_enforces_owner():
     session_id, _ = session_manager.get_or_create_session(None, user_id="owner-user")
 
@@ -75,9 +126,7 @@ def test_get_session_purges_expired_entries():
     session_id, _ = session_manager.get_or_create_session(None, user_id="ttl-user")
 
     # Stale the cache entry and ensure the read path purges it before reload.
-    session_manager._session_cache[session_id].last_access = datetime.now() - timedelta(
-        minutes=2
-    )
+    session_manager._session_cache[session_id].last_access = time.monotonic() - 120
 
     reloaded = session_manager.get_session(session_id)
     assert reloaded is not None
@@ -95,13 +144,12 @@ def test_reasoning_messages_retained_in_storage():
     }
     user_item: dict[str, Any] = {"role": "user", "content": "שלום"}
 
-    run_async(
-        session.add_items(
-            [
-                cast(TResponseInputItem, reasoning_item),
-                cast(TResponseInputItem, user_item),
-            ]
-        )
+    _add_items_and_flush(
+        session,
+        [
+            cast(TResponseInputItem, reasoning_item),
+            cast(TResponseInputItem, user_item),
+        ],
     )
 
     stored_items = run_async(session.get_items())
@@ -150,6 +198,34 @@ def test_ephemeral_message_temporary():
             db.commit()
 
 
+def test_pop_ephemeral_message_removes_only_its_own_item():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="ephemeral-order-user"
+    )
+    try:
+        first_id = session.push_ephemeral_message("system", "hint")
+        _add_items_and_flush(
+            session, [cast(TResponseInputItem, {"role": "user", "content": "q"})]
+        )
+        second_id = session.push_ephemeral_message("system", "hint")
+        _add_items_and_flush(
+            session, [cast(TResponseInputItem, {"role": "assistant", "content": "a"})]
+        )
+
+        session.pop_ephemeral_message(second_id)
+        contents = [item["content"] for item in run_async(session.get_items())]
+        assert contents == ["hint", "q", "a"]
+
+        session.pop_ephemeral_message(first_id)
+        contents = [item["content"] for item in run_async(session.get_items())]
+        assert contents == ["q", "a"]
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
 def test_document_artifacts_persist_and_reload(tmp_path):
     session_id, session = session_manager.get_or_create_session(
         None, user_id="doc-user"
@@ -186,7 +262,13 @@ def test_document_artifacts_persist_and_reload(tmp_path):
             warnings=["lowConfidence"],
         )
 
-        session.set_document_extract(document_id, extract)
+        stub = session.get_document(document_id)
+        updated = session.set_document_extract(document_id, extract)
+        assert updated is not None and updated.extract == extract
+        # Artifacts are immutable snapshots; earlier ones keep their state.
+        assert stub is not None and stub.extract is None
+        with pytest.raises(ValidationError):
+            updated.document_type = "other"  # type: ignore[misc]
 
         # Clear the in-memory cache to force reload from the database.
         session_manager.clear_all_sessions()
@@ -205,3 +287,304 @@ def test_document_artifacts_persist_and_reload(tmp_path):
             repo = SessionRepository(db)
             repo.delete_session(session_id)
             db.commit()
+
+
+def test_get_items_returns_detached_copies():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="copy-user"
+    )
+    try:
+        item: dict[str, Any] = {
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": "שלום"}],
+        }
+        run_async(session.add_items([cast(TResponseInputItem, item)]))
+        item["content"][0]["text"] = "mutated by caller"
+
+        first = run_async(session.get_items())
+        cast(dict[str, Any], first[0])["content"].append({"type": "extra"})
+
+        second = run_async(session.get_items())
+        assert cast(dict[str, Any], second[0])["content"] == [
+            {"type": "output_text", "text": "שלום"}
+        ]
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_concurrent_history_writes_persist_in_order():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="batch-user"
+    )
+
+    async def _write_concurrently() -> None:
+        await asyncio.gather(
+            *(
+                session.add_items(
+                    [cast(TResponseInputItem, {"role": "user", "content": str(idx)})]
+                )
+                for idx in range(5)
+            )
+        )
+        await session.pop_item()
+
+    try:
+        run_async(_write_concurrently())
+
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            persisted = [
+                row.content["content"] for row in repo.list_messages(session_id)
+            ]
+        assert persisted == ["0", "1", "2", "3"]
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_timeline_watchers_share_encoded_updates():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="timeline-user"
+    )
+
+    async def _collect() -> list[Any]:
+        first = session.register_timeline_watcher()
+        second = session.register_timeline_watcher()
+        try:
+            for event_id, title in (
+                ("evt-1", "פגישת ייעוץ"),
+                ("evt-2", "אישור עקרוני"),
+            ):
+                await session.apply_timeline_update(
+                    lambda state, event_id=event_id, title=title: state.upsert_event(
+                        TimelineEvent(
+                            id=event_id,
+                            type=TimelineEventType.UPDATE,
+                            title=title,
+                            stage=TimelineStage.CONSULTATION,
+                        )
+                    )
+                )
+            updates = [await first.get(), await second.get()]
+            # Both updates landed before the reads, so they were coalesced.
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(first.get(), timeout=0.01)
+            return updates
+        finally:
+            session.unregister_timeline_watcher(first)
+            session.unregister_timeline_watcher(second)
+
+    try:
+        first_update, second_update = run_async(_collect())
+        payload, encoded = first_update
+        assert second_update is first_update
+        assert json.loads(encoded) == payload
+        assert [event["title"] for event in payload["events"]] == [
+            "פגישת ייעוץ",
+            "אישור עקרוני",
+        ]
+        assert session.get_timeline_payload() is payload
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_timeline_snapshots_survive_later_updates():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="timeline-snapshot-user"
+    )
+
+    def _event(event_id: str) -> TimelineEvent:
+        return TimelineEvent(
+            id=event_id,
+            type=TimelineEventType.CONSULTATION,
+            title=event_id,
+            stage=TimelineStage.CONSULTATION,
+            status=TimelineEventStatus.ACTIVE,
+        )
+
+    try:
+        first = run_async(
+            session.apply_timeline_update(lambda state: state.upsert_event(_event("a")))
+        )
+        second = run_async(
+            session.apply_timeline_update(lambda state: state.upsert_event(_event("b")))
+        )
+
+        assert [event.status for event in first.events] == [TimelineEventStatus.ACTIVE]
+        assert [event.status for event in second.events] == [
+            TimelineEventStatus.COMPLETED,
+            TimelineEventStatus.ACTIVE,
+        ]
+        assert session.get_timeline().events[1] is second.events[1]
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_stored_models_are_shared_read_only():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="copies-user"
+    )
+    try:
+        submission = build_submission()
+        planning = build_planning_context(submission)
+        result = optimize_mixes(submission.record, planning)
+
+        stored_planning = session.set_planning_context(planning)
+        stored_result = session.set_optimization_result(result)
+        assert stored_planning == planning and stored_planning is not planning
+        assert stored_result == result and stored_result is not result
+
+        assert session.get_optimization_result() is stored_result
+        assert session.get_planning_context() is stored_planning
+        with pytest.raises(ValidationError):
+            stored_result.recommended_index = len(result.candidates)
+        with pytest.raises(ValidationError):
+            stored_planning.metadata = {}
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_reloaded_session_fetches_stored_models_on_demand():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="lazy-user"
+    )
+    try:
+        submission = build_submission()
+        planning = build_planning_context(submission)
+        result = optimize_mixes(submission.record, planning)
+        session.set_planning_context(planning)
+        session.set_optimization_result(result)
+
+        session_manager.clear_all_sessions()
+        reloaded = session_manager.get_session(session_id, user_id="lazy-user")
+        assert reloaded is not None and reloaded is not session
+        assert not reloaded._planning_loaded
+        assert not reloaded._optimization_loaded
+
+        assert reloaded.get_planning_context() == planning
+        assert reloaded.get_optimization_result() == result
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_reloaded_session_restores_history_and_timeline():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="bundle-user"
+    )
+    items = [
+        cast("TResponseInputItem", {"role": "user", "content": f"הודעה {idx}"})
+        for idx in range(3)
+    ]
+    try:
+        _add_items_and_flush(session, items)
+        run_async(
+            session.apply_timeline_update(
+                lambda state: state.upsert_event(
+                    TimelineEvent(
+                        id="evt-bundle",
+                        type=TimelineEventType.DOCUMENT,
+                        title="מסמכים",
+                        stage=TimelineStage.DOCUMENTS,
+                        status=TimelineEventStatus.ACTIVE,
+                    )
+                )
+            )
+        )
+
+        session_manager.clear_all_sessions()
+        reloaded = session_manager.get_session(session_id, user_id="bundle-user")
+        assert reloaded is not None
+
+        assert run_async(reloaded.get_items()) == items
+        timeline = reloaded.get_timeline()
+        assert [event.id for event in timeline.events] == ["evt-bundle"]
+        assert timeline.current_stage is TimelineStage.DOCUMENTS
+        assert timeline.version == 1
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_flush_pending_writes_persists_background_history():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="flush-user"
+    )
+
+    async def _write_then_shutdown() -> None:
+        for idx in range(3):
+            await session.add_items(
+                [cast(TResponseInputItem, {"role": "user", "content": str(idx)})]
+            )
+        await session_manager.flush_pending_writes()
+
+    try:
+        run_async(_write_then_shutdown())
+
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            persisted = [
+                row.content["content"] for row in repo.list_messages(session_id)
+            ]
+        assert persisted == ["0", "1", "2"]
+        assert not session_manager._background_writes
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
+
+
+def test_concurrent_timeline_updates_persist_latest_state():
+    session_id, session = session_manager.get_or_create_session(
+        None, user_id="timeline-batch-user"
+    )
+
+    def _upsert(event_id: str) -> Callable[[TimelineState], TimelineEvent]:
+        return lambda state: state.upsert_event(
+            TimelineEvent(
+                id=event_id,
+                type=TimelineEventType.UPDATE,
+                title=event_id,
+                stage=TimelineStage.CONSULTATION,
+            )
+        )
+
+    async def _update_concurrently() -> None:
+        await asyncio.gather(
+            *(session.apply_timeline_update(_upsert(f"evt-{idx}")) for idx in range(4))
+        )
+
+    try:
+        run_async(_update_concurrently())
+
+        with SessionLocal() as db:
+            stored = SessionRepository(db).get_timeline(session_id)
+        assert stored is not None
+        assert stored["version"] == 4
+        assert [event["id"] for event in stored["events"]] == [
+            f"evt-{idx}" for idx in range(4)
+        ]
+    finally:
+        with SessionLocal() as db:
+            repo = SessionRepository(db)
+            repo.delete_session(session_id)
+            db.commit()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Iterator
+from typing import Any, Callable, Iterator
 
 import pytest
 
@@ -37,6 +37,16 @@ def session_cleanup() -> Iterator[Callable[[str], None]]:
             db.commit()
 
 
+def _add_items_and_flush(
+    session: session_manager.PersistentSession, items: list[Any]
+) -> None:
+    async def _run() -> None:
+        await session.add_items(items)
+        await session.flush()
+
+    run_async(_run())
+
+
 def _create_session(user_id: str, session_cleanup: Callable[[str], None]) -> str:
     session_id, _ = session_manager.get_or_create_session(None, user_id=user_id)
     session_cleanup(session_id)
@@ -50,7 +60,7 @@ def test_list_user_sessions_returns_summary(
     session_id, session = session_manager.get_or_create_session(None, user_id=user_id)
     session_cleanup(session_id)
 
-    run_async(session.add_items([{"role": "user", "content": "hello there"}]))
+    _add_items_and_flush(session, [{"role": "user", "content": "hello there"}])
 
     summaries = list_user_sessions(user_id)
     assert len(summaries) == 1
@@ -85,7 +95,7 @@ def test_get_session_detail_returns_history(
     session_id, session = session_manager.get_or_create_session(None, user_id=user_id)
     session_cleanup(session_id)
 
-    run_async(session.add_items([{"role": "user", "content": "hello detail"}]))
+    _add_items_and_flush(session, [{"role": "user", "content": "hello detail"}])
 
     detail = get_session_detail(session_id, user_id)
     assert detail is not None
@@ -119,7 +129,7 @@ def test_reasoning_entries_hidden_from_api(
         {"id": "rs_test", "type": "reasoning", "summary": []},
         {"role": "assistant", "content": "שלום"},
     ]
-    run_async(session.add_items(items))
+    _add_items_and_flush(session, items)
 
     summaries = list_user_sessions(user_id)
     assert summaries[0].message_count == 2